@@ -51,6 +51,24 @@ PATTERNS = {
     },
 }
 
+# Substrings typical of OCR'd margin line numbers (numbers 1-28): B, Be, Bw, NH, YN, ND, WwW, etc.
+GIBBERISH_INDICATORS = (
+    "WwW", "wWw", "Ww", "wW",  # Mixed case w
+    "Bw", "wB", "BW",
+    "ND", "YN", "NH", "NM",  # Common OCR of numbers
+    "FB", "FF", "FW",
+    "eB", "Be", "eH",
+    "mw", "mn", "nn",
+    "fF", "Ff",
+    "Se", "Oe", "oO",
+    "HD", "SS",
+    "DAH", "DAW", "UDF",
+)
+
+# Repeated Be/eB runs, and lines made only of 1-3 letter tokens (e.g. "RN YN YN NNN YD")
+BE_REPEAT_PATTERN = re.compile(r"([BeE]{2}\s*){3,}")
+SHORT_TOKENS_PATTERN = re.compile(r"^([A-Za-z]{1,3}\s+){4,}[A-Za-z]{1,3}$")
+
 
 def is_gibberish_line(line: str) -> bool:
     """
@@ -84,33 +102,8 @@ def is_gibberish_line(line: str) -> bool:
     if avg_len > 3.5:
         return False
 
-    # Check for mixed case gibberish pattern (random caps)
-    # Real text usually has consistent capitalization
-    has_mixed_case_words = 0
-    for word in words:
-        if len(word) >= 2:
-            # Check if word has mixed case in middle (like "wWwN", "BwW")
-            uppers = sum(1 for c in word if c.isupper())
-            lowers = sum(1 for c in word if c.islower())
-            if uppers > 0 and lowers > 0 and len(word) <= 4:
-                has_mixed_case_words += 1
-
     # Check for specific gibberish patterns (OCR of numbers 1-28)
-    # These often contain: B, Be, Bw, NH, YN, ND, WwW, etc.
-    gibberish_indicators = [
-        "WwW", "wWw", "Ww", "wW",  # Mixed case w
-        "Bw", "wB", "BW",
-        "ND", "YN", "NH", "NM",  # Common OCR of numbers
-        "FB", "FF", "FW",
-        "eB", "Be", "eH",
-        "mw", "mn", "nn",
-        "fF", "Ff",
-        "Se", "Oe", "oO",
-        "HD", "SS",
-        "DAH", "DAW", "UDF",
-    ]
-
-    indicator_count = sum(1 for ind in gibberish_indicators if ind in stripped)
+    indicator_count = sum(ind in stripped for ind in GIBBERISH_INDICATORS)
 
     # If we have multiple gibberish indicators plus short words, it's gibberish
     if indicator_count >= 2 and short_ratio >= 0.6:
@@ -124,12 +117,11 @@ def is_gibberish_line(line: str) -> bool:
         return True
 
     # Check for repeated Be/eB patterns (common in line number OCR)
-    be_pattern = re.compile(r"([BeE]{2}\s*){3,}")
-    if be_pattern.search(stripped):
+    if BE_REPEAT_PATTERN.search(stripped):
         return True
 
     # Pattern like "RN YN YN NNN YD" - repeated 2-char sequences
-    if re.match(r"^([A-Za-z]{1,3}\s+){4,}[A-Za-z]{1,3}$", stripped):
+    if SHORT_TOKENS_PATTERN.match(stripped):
         # Check if it's not real abbreviations by looking for variety
         unique_words = set(w.upper() for w in words)
         if len(unique_words) < len(words) * 0.7:  # Many repeats
@@ -7,28 +7,97 @@ Usage:
     uv run scripts/process_settlements.py --limit 10         # Process only 10 settlements
     uv run scripts/process_settlements.py --reprocess        # Reprocess all settlements
     uv run scripts/process_settlements.py --dry-run          # Preview without processing
+    uv run scripts/process_settlements.py --concurrency 2    # Limit concurrent OpenAI requests
+    uv run scripts/process_settlements.py --tpm 90000        # Raise tokens-per-minute budget
+    uv run scripts/process_settlements.py --no-cache         # Ignore cached LLM responses
 """
 
+import asyncio
+import functools
+import hashlib
 import json
 import os
 import argparse
+import random
+import re
+import tempfile
+import time
+from collections import Counter
+from collections.abc import Iterable
+from contextlib import asynccontextmanager
 from pathlib import Path
 from datetime import datetime, timezone
+from typing import Optional
 
 from dotenv import load_dotenv
-from openai import OpenAI
-from pymongo import MongoClient
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    AsyncOpenAI,
+    InternalServerError,
+    RateLimitError,
+)
+from pydantic import BaseModel, ValidationError
+from pymongo import MongoClient, UpdateOne
+from pymongo.errors import BulkWriteError, PyMongoError
 
 load_dotenv()
 
-# Load the extraction prompt
-PROMPT_PATH = Path(__file__).parent / "prompts" / "settlement_extraction.md"
-
-
-def load_prompt() -> str:
-    """Load the extraction prompt from file."""
-    with open(PROMPT_PATH, "r") as f:
-        return f.read()
+# Load the extraction prompt once; its hash versions the LLM response cache
+PROMPT_PATH = Path(__file__).parent.parent / "prompts" / "settlement_extraction.md"
+SYSTEM_PROMPT = PROMPT_PATH.read_text()
+PROMPT_SHA = hashlib.sha256(SYSTEM_PROMPT.encode()).hexdigest()[:12]
+
+# Token estimate used for rate limiting (no tokenizer dependency)
+CHARS_PER_TOKEN = 4
+ESTIMATED_OUTPUT_TOKENS = 1000
+
+# Retry settings for transient OpenAI failures
+MAX_ATTEMPTS = 6
+RETRY_MIN_DELAY = 1.0   # seconds
+RETRY_MAX_DELAY = 60.0  # seconds
+RETRYABLE_ERRORS = (RateLimitError, APIConnectionError, APITimeoutError, InternalServerError)
+
+# Number of settlement upserts queued before a bulk_write flush
+BULK_WRITE_BATCH_SIZE = 100
+
+# Start of a line containing any non-whitespace (counted without splitting the text)
+NON_BLANK_LINE_PATTERN = re.compile(r"^[^\S\n]*\S", re.MULTILINE)
+
+# Whitespace noise in OCR output, stripped before sending text to the LLM
+TRAILING_WHITESPACE_PATTERN = re.compile(r"[ \t]+$", re.MULTILINE)
+BLANK_LINES_PATTERN = re.compile(r"\n{3,}")
+
+# Document types treated as settlements (exact match, or prefix of a malformed type)
+SETTLEMENT_TYPES = (
+    # Primary settlement types
+    "Settlement Agreement and Order",
+    "Settlement, Waiver and Consent Agreement",
+    "Settlement, Waiver and Consent Agreement and Order",  # +112 documents
+    "Settlement Agreement",
+    # Amended settlements
+    "Amended Settlement Agreement and Order",
+    "First Amended Settlement Agreement and Order",
+    "Settlement Agreement and Order Lifting Suspension",
+    # Combined stipulation + settlement
+    "Stipulation and Settlement, Waiver and Consent Agreement and Order",
+    # Consent agreements (functionally settlements)
+    "Consent Agreement for Revocation of License",
+    # Modification orders (update existing settlements)
+    "Order Modifying Previously Approved Settlement Agreement",
+    "Order Modifying Terms of Previously Approved Settlement Agreement",
+    "Order Modifying Conditions of Settlement Agreement",
+    "Order Amending Settlement Agreement",
+    "Stipulation and Order Amending Terms of Settlement Agreement",
+    "Addendum to Previously Adopted Settlement",
+    "Order Vacating Remaining Term of Previously Adopted Settlement, Waiver and Consent Agreement",
+    # Findings of Fact (contested cases that went to hearing)
+    "Findings of Fact, Conclusions of Law and Order",
+    "Findings of Fact, Conclusions of Law, and Order",  # Variant with comma
+    "Amended Findings of Fact, Conclusions of Law and Order",
+    "Findings of Fact, Conclustions of Law and Order",  # Typo in source data
+)
+SETTLEMENT_TYPE_SET = frozenset(SETTLEMENT_TYPES)
 
 
 def get_mongo_client() -> MongoClient:
@@ -39,23 +108,30 @@ def get_mongo_client() -> MongoClient:
     return MongoClient(mongo_uri)
 
 
-def get_openai_client() -> OpenAI:
-    """Create OpenAI client from environment variable."""
+def get_openai_client() -> AsyncOpenAI:
+    """Create async OpenAI client from environment variable."""
     api_key = os.environ.get("OPENAI_API_KEY")
     if not api_key:
         raise ValueError("OPENAI_API_KEY environment variable is required")
-    return OpenAI(api_key=api_key)
+    # with_retries owns retrying (and charges the rate limiter per attempt), so the SDK mustn't retry too
+    return AsyncOpenAI(api_key=api_key, max_retries=0)
 
 
 def load_filings_metadata(data_dir: Path) -> list[dict]:
     """Load filings metadata from JSON file."""
     filings_path = data_dir / "filings_normalized.json"
-    with open(filings_path, "r") as f:
-        data = json.load(f)
-    return data["filings"]
+    return json.loads(filings_path.read_bytes())["filings"]
+
 
+def matches_settlement_type(filing_type: str) -> bool:
+    """Check whether a filing type is a settlement, allowing extra text appended to the type."""
+    if filing_type in SETTLEMENT_TYPE_SET:
+        return True
+    # Handle malformed types like "Findings of Fact, Conclusions of Law and Order Elliott Schmerler, MD"
+    return filing_type.startswith(SETTLEMENT_TYPES)
 
-def filter_settlements(filings: list[dict]) -> list[dict]:
+
+def filter_settlements(filings: Iterable[dict]) -> list[dict]:
     """
     Filter filings to only include settlements, deduplicated by pdf_url.
 
@@ -63,47 +139,8 @@ def filter_settlements(filings: list[dict]) -> list[dict]:
     are expanded into multiple entries in filings_normalized.json, but they all
     share the same PDF. We consolidate them into a single entry with all case_numbers.
     """
-    settlement_types = [
-        # Primary settlement types
-        "Settlement Agreement and Order",
-        "Settlement, Waiver and Consent Agreement",
-        "Settlement, Waiver and Consent Agreement and Order",  # +112 documents
-        "Settlement Agreement",
-        # Amended settlements
-        "Amended Settlement Agreement and Order",
-        "First Amended Settlement Agreement and Order",
-        "Settlement Agreement and Order Lifting Suspension",
-        # Combined stipulation + settlement
-        "Stipulation and Settlement, Waiver and Consent Agreement and Order",
-        # Consent agreements (functionally settlements)
-        "Consent Agreement for Revocation of License",
-        # Modification orders (update existing settlements)
-        "Order Modifying Previously Approved Settlement Agreement",
-        "Order Modifying Terms of Previously Approved Settlement Agreement",
-        "Order Modifying Conditions of Settlement Agreement",
-        "Order Amending Settlement Agreement",
-        "Stipulation and Order Amending Terms of Settlement Agreement",
-        "Addendum to Previously Adopted Settlement",
-        "Order Vacating Remaining Term of Previously Adopted Settlement, Waiver and Consent Agreement",
-        # Findings of Fact (contested cases that went to hearing)
-        "Findings of Fact, Conclusions of Law and Order",
-        "Findings of Fact, Conclusions of Law, and Order",  # Variant with comma
-        "Amended Findings of Fact, Conclusions of Law and Order",
-        "Findings of Fact, Conclustions of Law and Order",  # Typo in source data
-    ]
-
-    # Also match types that have extra text appended (e.g., doctor name in type field)
-    def matches_settlement_type(filing_type: str) -> bool:
-        if filing_type in settlement_types:
-            return True
-        # Handle malformed types like "Findings of Fact, Conclusions of Law and Order Elliott Schmerler, MD"
-        for st in settlement_types:
-            if filing_type.startswith(st):
-                return True
-        return False
-
-    # Filter to only settlements
-    all_settlements = [f for f in filings if matches_settlement_type(f.get("type", ""))]
+    # Filter to only settlements lazily, feeding matches straight into the dedup pass
+    all_settlements = (f for f in filings if matches_settlement_type(f.get("type", "")))
 
     # Deduplicate by pdf_url, collecting all case_numbers for each unique PDF
     by_pdf_url: dict[str, dict] = {}
@@ -127,8 +164,42 @@ def filter_settlements(filings: list[dict]) -> list[dict]:
     return list(by_pdf_url.values())
 
 
-def get_text_file_path(filing: dict, text_dir: Path) -> Path | None:
-    """Construct the path to the cleaned text file for a filing.
+def build_text_index(text_dir: Path) -> dict[str, dict[str, list[Path]]]:
+    """
+    Index text files as {year: {case_number: [paths]}} with one directory scan per year.
+
+    The case number is the filename part before the first underscore, matching the
+    {case_number}_{document_type}.txt naming used by the OCR step.
+    """
+    index: dict[str, dict[str, list[Path]]] = {}
+    if not text_dir.exists():
+        return index
+
+    for year_dir in text_dir.iterdir():
+        if not year_dir.is_dir():
+            continue
+        by_case: dict[str, list[Path]] = {}
+        with os.scandir(year_dir) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                if entry.is_file() and entry.name.endswith(".txt"):
+                    case_number = entry.name.split("_", 1)[0]
+                    by_case.setdefault(case_number, []).append(Path(entry.path))
+        index[year_dir.name] = by_case
+
+    return index
+
+
+def find_resolution_file(paths: list[Path]) -> Path | None:
+    """Return the first settlement/findings text file from a list of candidates."""
+    for txt_file in paths:
+        fname_lower = txt_file.name.lower()
+        if "settlement" in fname_lower or "findings" in fname_lower:
+            return txt_file
+    return None
+
+
+def get_text_file_path(filing: dict, text_index: dict[str, dict[str, list[Path]]]) -> Path | None:
+    """Look up the cleaned text file for a filing in the index from build_text_index.
 
     For multi-case settlements, the file is named with the first case_number.
     """
@@ -141,8 +212,8 @@ def get_text_file_path(filing: dict, text_dir: Path) -> Path | None:
     # Normalize document type for filename
     type_slug = doc_type.replace(" ", "_").replace(",", "")
 
-    year_dir = text_dir / str(year)
-    if not year_dir.exists():
+    files_by_case = text_index.get(str(year))
+    if files_by_case is None:
         return None
 
     # Try different filename patterns with primary case number
@@ -152,17 +223,17 @@ def get_text_file_path(filing: dict, text_dir: Path) -> Path | None:
     ]
 
     # Search for matching file
+    primary_files = files_by_case.get(primary_case_number, [])
     for pattern in patterns:
-        candidate = year_dir / pattern
-        if candidate.exists():
-            return candidate
+        for candidate in primary_files:
+            if candidate.name == pattern:
+                return candidate
 
     # Fallback: search for files starting with any of the case numbers
     for case_number in case_numbers:
-        for txt_file in year_dir.glob(f"{case_number}_*.txt"):
-            fname_lower = txt_file.name.lower()
-            if "settlement" in fname_lower or "findings" in fname_lower:
-                return txt_file
+        match = find_resolution_file(files_by_case.get(case_number, []))
+        if match:
+            return match
 
     # Second fallback: handle -1 vs -01 suffix variations
     # e.g., case_number "05-9441-1" should match file "05-9441-01_..."
@@ -173,34 +244,230 @@ def get_text_file_path(filing: dict, text_dir: Path) -> Path | None:
             base, suffix = parts
             padded_suffix = suffix.zfill(2)  # "1" -> "01"
             alt_case_number = f"{base}-{padded_suffix}"
-            for txt_file in year_dir.glob(f"{alt_case_number}_*.txt"):
-                fname_lower = txt_file.name.lower()
-                if "settlement" in fname_lower or "findings" in fname_lower:
-                    return txt_file
+            match = find_resolution_file(files_by_case.get(alt_case_number, []))
+            if match:
+                return match
 
     return None
 
 
 def read_text_file(path: Path) -> str:
     """Read and return the contents of a text file."""
-    with open(path, "r", encoding="utf-8", errors="replace") as f:
-        return f.read()
+    return path.read_text(encoding="utf-8", errors="replace")
 
 
-def call_openai(client: OpenAI, system_prompt: str, user_content: str, model: str = "gpt-4o") -> dict:
-    """Call OpenAI API and parse JSON response."""
-    response = client.chat.completions.create(
-        model=model,
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_content}
-        ],
-        temperature=0.1,
-        response_format={"type": "json_object"}
-    )
+class RateLimiter:
+    """
+    Proactive OpenAI throttle: caps in-flight requests and paces RPM/TPM budgets.
+
+    Modeled on openai-cookbook's api_request_parallel_processor. Request and token
+    budgets refill continuously at limit/60 per second; a request waits until both
+    budgets can cover it instead of firing and eating a 429. A limit of 0 disables
+    that budget (same pacing as process_single_file.RateLimiter).
+    """
+
+    def __init__(self, concurrency: int, rpm: int, tpm: int):
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.rpm = rpm
+        self.tpm = tpm
+        self.available_requests = float(rpm)
+        self.available_tokens = float(tpm)
+        self.last_update = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self.last_update
+        self.available_requests = min(self.rpm, self.available_requests + self.rpm / 60 * elapsed)
+        self.available_tokens = min(self.tpm, self.available_tokens + self.tpm / 60 * elapsed)
+        self.last_update = now
+
+    async def _reserve(self, tokens: int):
+        if not self.rpm and not self.tpm:
+            return
+        tokens = min(tokens, self.tpm)  # Oversized requests wait for a full bucket
+        async with self.lock:
+            while True:
+                self._refill()
+                request_short = 1 - self.available_requests if self.rpm else 0
+                token_short = tokens - self.available_tokens if self.tpm else 0
+                if request_short <= 0 and token_short <= 0:
+                    self.available_requests -= 1
+                    self.available_tokens -= tokens
+                    return
+                await asyncio.sleep(max(
+                    request_short * 60 / self.rpm if self.rpm else 0,
+                    token_short * 60 / self.tpm if self.tpm else 0,
+                ))
+
+    @asynccontextmanager
+    async def limit(self, tokens: int):
+        """Hold a concurrency slot and reserve rate budget for one request."""
+        async with self.semaphore:
+            await self._reserve(tokens)
+            yield
+
+
+class ExtractionCache:
+    """
+    Content-addressable on-disk cache of LLM extraction responses.
+
+    Keyed on sha256 of (model, prompt version, user content), so a response is
+    reused only when the exact same request would be sent again (e.g. --reprocess
+    or a rerun after a crash). Stored as {cache_dir}/{key[:2]}/{key}.json.
+    """
+
+    def __init__(self, cache_dir: Path, prompt_version: str):
+        self.cache_dir = cache_dir
+        self.prompt_version = prompt_version
+
+    def key(self, model: str, user_content: str) -> str:
+        content = user_content.encode()
+        # Length-prefix the content so field boundaries can't collide
+        header = f"{model}|{self.prompt_version}|{len(content)}|".encode()
+        return hashlib.sha256(header + content).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> dict | None:
+        try:
+            return json.loads(self._path(key).read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, value: dict):
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Unique temp name: concurrent workers may write the same key (identical chunks)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=path.parent, prefix=f"{key}.", suffix=".tmp", delete=False
+        ) as tmp:
+            tmp.write(json.dumps(value, separators=(",", ":")))
+        os.replace(tmp.name, path)
+
+
+def estimate_tokens(system_prompt: str, user_content: str) -> int:
+    """Rough token cost of a request (prompt + expected completion)."""
+    return (len(system_prompt) + len(user_content)) // CHARS_PER_TOKEN + ESTIMATED_OUTPUT_TOKENS
+
+
+def get_retry_delay(error: Exception, attempt: int) -> float:
+    """Backoff before the next attempt: Retry-After if given, else random exponential."""
+    if isinstance(error, RateLimitError):
+        retry_after = error.response.headers.get("retry-after", "")
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+    return random.uniform(RETRY_MIN_DELAY, min(RETRY_MAX_DELAY, RETRY_MIN_DELAY * 2 ** attempt))
+
+
+def with_retries(func):
+    """Retry an async OpenAI call on transient errors with jittered exponential backoff."""
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                return await func(*args, **kwargs)
+            except RETRYABLE_ERRORS as e:
+                if attempt == MAX_ATTEMPTS - 1:
+                    raise
+                delay = get_retry_delay(e, attempt)
+                print(f"  ⟳ {type(e).__name__}, retrying in {delay:.1f}s (attempt {attempt + 2}/{MAX_ATTEMPTS})")
+                await asyncio.sleep(delay)
+    return wrapper
+
+
+class ExtractedViolation(BaseModel):
+    """Admitted NRS violation."""
+    count: str
+    nrs_code: str
+    description: str
+
+
+class SettlementExtraction(BaseModel):
+    """Structured Outputs schema for settlement_extraction.md (all fields required by the API)."""
+    summary: str
+    license_action: str
+    probation_months: Optional[int]
+    ineligible_to_reapply_months: Optional[int]
+    fine_amount: Optional[float]
+    investigation_costs: Optional[float]
+    charity_donation: Optional[float]
+    costs_payment_deadline_days: Optional[int]
+    costs_stayed: bool
+    cme_hours: Optional[int]
+    cme_topic: Optional[str]
+    cme_deadline_months: Optional[int]
+    public_reprimand: bool
+    npdb_report: bool
+    practice_restrictions: list[str]
+    monitoring_requirements: list[str]
+    violations_admitted: list[ExtractedViolation]
+
+
+@with_retries
+async def call_openai(
+    client: AsyncOpenAI,
+    system_prompt: str,
+    user_content: str,
+    rate_limiter: RateLimiter,
+    model: str = "gpt-4o",
+    token_usage: Counter | None = None
+) -> dict:
+    """
+    Call OpenAI with a schema-enforced response and return it as a dict.
+
+    The response is streamed and parsed once complete. Throttled by `rate_limiter`;
+    retries transient errors. If the response fails validation, the error is sent
+    back to the model once before giving up.
+    Prompt/cached/completion token counts are added to `token_usage` if given.
+    """
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_content}
+    ]
 
-    content = response.choices[0].message.content
-    return json.loads(content)
+    for attempt in range(2):
+        async with rate_limiter.limit(estimate_tokens(system_prompt, user_content)):
+            try:
+                # Stream so long generations keep the connection active; the SDK
+                # accumulates deltas and validates the completed object
+                async with client.chat.completions.stream(
+                    model=model,
+                    messages=messages,
+                    temperature=0.1,
+                    response_format=SettlementExtraction,
+                    stream_options={"include_usage": True}
+                ) as stream:
+                    response = await stream.get_final_completion()
+            except ValidationError as e:
+                if attempt:
+                    raise
+                messages.append({
+                    "role": "user",
+                    "content": f"Your previous response failed schema validation:\n{e}\nReturn a corrected JSON object."
+                })
+                continue
+
+        if token_usage is not None and response.usage:
+            token_usage["prompt"] += response.usage.prompt_tokens
+            token_usage["completion"] += response.usage.completion_tokens
+            details = response.usage.prompt_tokens_details
+            token_usage["cached"] += (details.cached_tokens or 0) if details else 0
+
+        message = response.choices[0].message
+        if message.parsed is None:
+            raise ValueError(f"Model refused extraction: {message.refusal}")
+        return message.parsed.model_dump()
+
+
+def preprocess_text(text: str) -> str:
+    """Strip trailing whitespace and collapse runs of blank lines so OCR padding doesn't cost tokens."""
+    text = TRAILING_WHITESPACE_PATTERN.sub("", text)
+    text = BLANK_LINES_PATTERN.sub("\n\n", text)
+    return text.strip()
 
 
 def chunk_text(text: str, max_chars: int = 70000, overlap: int = 500) -> list[str]:
@@ -251,6 +518,11 @@ def merge_extraction_results(results: list[dict]) -> dict:
         "_chunk_count": len(results),
     }
 
+    # Keys already merged into each array, so dedup is a set lookup per item
+    seen_restrictions: set[str] = set()
+    seen_requirements: set[str] = set()
+    seen_nrs_codes: set = set()
+
     # Merge by taking first non-null value for scalars, union for arrays
     for r in results:
         if not merged["license_action"] and r.get("license_action"):
@@ -282,35 +554,29 @@ def merge_extraction_results(results: list[dict]) -> dict:
 
         # Merge arrays (deduplicate by converting to string for comparison)
         for restriction in r.get("practice_restrictions", []):
-            if restriction not in merged["practice_restrictions"]:
+            key = json.dumps(restriction, sort_keys=True)
+            if key not in seen_restrictions:
+                seen_restrictions.add(key)
                 merged["practice_restrictions"].append(restriction)
         for req in r.get("monitoring_requirements", []):
-            if req not in merged["monitoring_requirements"]:
+            key = json.dumps(req, sort_keys=True)
+            if key not in seen_requirements:
+                seen_requirements.add(key)
                 merged["monitoring_requirements"].append(req)
         for v in r.get("violations_admitted", []):
             # Dedupe by nrs_code
-            if not any(existing.get("nrs_code") == v.get("nrs_code") for existing in merged["violations_admitted"]):
+            if v.get("nrs_code") not in seen_nrs_codes:
+                seen_nrs_codes.add(v.get("nrs_code"))
                 merged["violations_admitted"].append(v)
 
     return merged
 
 
-def process_single_settlement(
-    filing: dict,
-    text_content: str,
-    openai_client: OpenAI,
-    system_prompt: str
-) -> dict:
-    """Process a single settlement through the LLM, chunking if necessary."""
-    MAX_CHARS = 70000  # ~17.5k tokens, leaving room for prompt and response
-
-    chunks = chunk_text(text_content, max_chars=MAX_CHARS)
-
-    results = []
-    for i, chunk in enumerate(chunks):
-        chunk_note = f"\n\n[This is part {i+1} of {len(chunks)} of the document]" if len(chunks) > 1 else ""
+def build_user_content(filing: dict, chunk: str, chunk_index: int, chunk_count: int) -> str:
+    """Build the user message for one chunk of a settlement document."""
+    chunk_note = f"\n\n[This is part {chunk_index+1} of {chunk_count} of the document]" if chunk_count > 1 else ""
 
-        user_content = f"""## Metadata
+    return f"""## Metadata
 
 - **Title:** {filing.get('title', 'Unknown')}
 - **Respondent:** {filing.get('respondent', 'Unknown')}
@@ -322,10 +588,43 @@ def process_single_settlement(
 
 {chunk}
 """
-        result = call_openai(openai_client, system_prompt, user_content)
-        results.append(result)
 
-    return merge_extraction_results(results)
+
+async def process_single_settlement(
+    filing: dict,
+    text_content: str,
+    openai_client: AsyncOpenAI,
+    system_prompt: str,
+    rate_limiter: RateLimiter,
+    model: str = "gpt-4o",
+    cache: ExtractionCache | None = None,
+    token_usage: Counter | None = None
+) -> dict:
+    """
+    Process a single settlement through the LLM, chunking if necessary.
+
+    Chunks are extracted concurrently (still throttled by `rate_limiter`) and
+    merged afterward. Uses `cache` if given and tallies OpenAI usage into `token_usage`.
+    """
+    MAX_CHARS = 70000  # ~17.5k tokens, leaving room for prompt and response
+
+    chunks = chunk_text(preprocess_text(text_content), max_chars=MAX_CHARS)
+
+    async def extract_chunk(i: int, chunk: str) -> dict:
+        user_content = build_user_content(filing, chunk, i, len(chunks))
+        cache_key = cache.key(model, user_content) if cache else None
+        result = await asyncio.to_thread(cache.get, cache_key) if cache else None
+        if result is None:
+            result = await call_openai(
+                openai_client, system_prompt, user_content, rate_limiter, model, token_usage
+            )
+            if cache:
+                await asyncio.to_thread(cache.set, cache_key, result)
+        return result
+
+    results = await asyncio.gather(*(extract_chunk(i, chunk) for i, chunk in enumerate(chunks)))
+
+    return merge_extraction_results(list(results))
 
 
 def main():
@@ -336,11 +635,13 @@ def main():
     parser.add_argument("--data-dir", type=Path, default=Path("data"), help="Data directory")
     parser.add_argument("--text-dir", type=Path, default=Path("text"), help="Text files directory")
     parser.add_argument("--model", type=str, default="gpt-4o", help="OpenAI model to use")
+    parser.add_argument("--concurrency", type=int, default=4, help="Max concurrent OpenAI requests (default: 4)")
+    parser.add_argument("--rpm", type=int, default=500, help="OpenAI requests-per-minute budget (default: 500, 0 = unlimited)")
+    parser.add_argument("--tpm", type=int, default=30000, help="OpenAI tokens-per-minute budget (default: 30000, 0 = unlimited)")
+    parser.add_argument("--no-cache", action="store_true", help="Don't read or write the LLM response cache")
     args = parser.parse_args()
 
-    # Load prompt
-    print("Loading extraction prompt...")
-    system_prompt = load_prompt()
+    cache = None if args.no_cache else ExtractionCache(args.data_dir / "llm_cache", PROMPT_SHA)
 
     # Connect to services (skip in dry-run)
     if not args.dry_run:
@@ -354,6 +655,12 @@ def main():
         settlements_collection.create_index("pdf_url", unique=True)
         # Create index on case_numbers for lookups
         settlements_collection.create_index("case_numbers")
+        # Partial index covering the already-processed pdf_url lookup
+        settlements_collection.create_index(
+            "pdf_url",
+            partialFilterExpression={"llm_extracted": {"$exists": True}},
+            name="pdf_url_extracted_partial"
+        )
 
         print("Connecting to OpenAI...")
         openai_client = get_openai_client()
@@ -363,19 +670,16 @@ def main():
 
     # Load and filter filings
     print("Loading filings metadata...")
-    filings = load_filings_metadata(args.data_dir)
-    settlements = filter_settlements(filings)
+    # Not bound to a name so the full filings list is freed once filtered
+    settlements = filter_settlements(load_filings_metadata(args.data_dir))
     print(f"Found {len(settlements)} settlement documents")
 
     # Filter out already processed (unless reprocessing)
     if not args.dry_run and not args.reprocess:
         processed_pdf_urls = set(
-            doc["pdf_url"]
-            for doc in settlements_collection.find(
-                {"llm_extracted": {"$exists": True}},
-                {"pdf_url": 1}
+            settlements_collection.distinct(
+                "pdf_url", {"llm_extracted": {"$exists": True}, "pdf_url": {"$nin": [None, ""]}}
             )
-            if doc.get("pdf_url")
         )
         settlements = [s for s in settlements if s.get("pdf_url") not in processed_pdf_urls]
         print(f"{len(settlements)} settlements remaining to process")
@@ -385,61 +689,95 @@ def main():
         settlements = settlements[:args.limit]
         print(f"Limited to {len(settlements)} settlements")
 
-    # Process each settlement
-    processed = 0
-    errors = 0
-    skipped = 0
+    # Index text files once instead of globbing year directories per settlement
+    text_index = build_text_index(args.text_dir)
+
+    # Prefetch complaint ids for linking in one query instead of one per case number
+    complaint_by_case = {}
+    if complaints_collection is not None:
+        all_case_numbers = {cn for s in settlements for cn in s.get("case_numbers", [])}
+        complaint_by_case = {
+            doc["case_number"]: doc["_id"]
+            for doc in complaints_collection.find(
+                {"case_number": {"$in": list(all_case_numbers)}},
+                {"_id": 1, "case_number": 1}
+            )
+        }
+
+    # Process settlements concurrently (OpenAI calls are network-bound)
+    rate_limiter = RateLimiter(args.concurrency, args.rpm, args.tpm)
+    counts = {"processed": 0, "skipped": 0, "error": 0}
+    token_usage = Counter()
+
+    # Settlement upserts are queued and written in unordered bulk batches
+    pending_ops: list[UpdateOne] = []
 
-    for i, filing in enumerate(settlements, 1):
+    def write_settlements(ops: list[UpdateOne]) -> int:
+        """Write queued settlement upserts in one unordered bulk_write. Returns how many failed."""
+        try:
+            result = settlements_collection.bulk_write(ops, ordered=False)
+            print(f"  💾 Stored {len(ops)} settlements in MongoDB ({result.upserted_count} new)")
+            return 0
+        except BulkWriteError as e:
+            failed = len(e.details.get("writeErrors", []))
+            print(f"  ✗ Bulk write failed for {failed} of {len(ops)} settlements")
+            return failed
+        except PyMongoError as e:
+            print(f"  ✗ Bulk write failed for {len(ops)} settlements: {e}")
+            return len(ops)
+
+    def count_write_failures(failed: int):
+        """Move settlements whose upsert failed from processed to error."""
+        counts["processed"] -= failed
+        counts["error"] += failed
+
+    async def flush_settlements():
+        """Write the queued upserts off the event loop."""
+        ops = pending_ops.copy()
+        pending_ops.clear()
+        count_write_failures(await asyncio.to_thread(write_settlements, ops))
+
+    async def process_filing(filing: dict) -> str:
+        """Process one settlement. Returns 'processed', 'skipped', or 'error'."""
         case_numbers = filing.get("case_numbers", [filing.get("case_number", "")])
         primary_case_number = case_numbers[0] if case_numbers else "unknown"
         pdf_url = filing.get("pdf_url", "")
 
+        def log(message: str):
+            print(f"  [{primary_case_number}] {message}")
+
         if len(case_numbers) > 1:
-            print(f"\n[{i}/{len(settlements)}] Processing {primary_case_number} (+{len(case_numbers)-1} sibling cases)...")
-        else:
-            print(f"\n[{i}/{len(settlements)}] Processing {primary_case_number}...")
+            log(f"Processing with {len(case_numbers)-1} sibling case(s)")
 
         # Find text file
-        text_path = get_text_file_path(filing, args.text_dir)
+        text_path = get_text_file_path(filing, text_index)
         if not text_path:
-            print(f"  ⚠ Text file not found, skipping")
-            skipped += 1
-            continue
+            log("⚠ Text file not found, skipping")
+            return "skipped"
 
-        # Read text content
-        text_content = read_text_file(text_path)
-        line_count = len([l for l in text_content.strip().split('\n') if l.strip()])
-        print(f"  📄 Loaded {len(text_content):,} characters, {line_count} lines from {text_path.name}")
+        # Read text content off the event loop so in-flight OpenAI requests aren't stalled
+        text_content = await asyncio.to_thread(read_text_file, text_path)
+        line_count = sum(1 for _ in NON_BLANK_LINE_PATTERN.finditer(text_content))
+        log(f"📄 Loaded {len(text_content):,} characters, {line_count} lines from {text_path.name}")
 
         # Check if OCR failed (only 1 line)
         ocr_failed = line_count <= 1
 
         if ocr_failed:
-            print(f"  ⚠ OCR failed (only {line_count} line), skipping LLM but storing metadata")
+            log(f"⚠ OCR failed (only {line_count} line), skipping LLM but storing metadata")
 
         if args.dry_run:
             if ocr_failed:
-                print(f"  [DRY RUN] Would store metadata only (no LLM)")
+                log("[DRY RUN] Would store metadata only (no LLM)")
             else:
-                print(f"  [DRY RUN] Would process and store this settlement")
-            processed += 1
-            continue
+                log("[DRY RUN] Would process and store this settlement")
+            return "processed"
 
         try:
-            # Look up linked complaints for ALL case_numbers
-            complaint_ids = []
-            if complaints_collection is not None:
-                for cn in case_numbers:
-                    complaint = complaints_collection.find_one(
-                        {"case_number": cn},
-                        {"_id": 1}
-                    )
-                    if complaint:
-                        complaint_ids.append(complaint["_id"])
-
-                if complaint_ids:
-                    print(f"  🔗 Linked to {len(complaint_ids)} complaint(s)")
+            # Link complaints for ALL case_numbers (prefetched before the loop)
+            complaint_ids = [complaint_by_case[cn] for cn in case_numbers if cn in complaint_by_case]
+            if complaint_ids:
+                log(f"🔗 Linked to {len(complaint_ids)} complaint(s)")
 
             # Build base document for MongoDB
             document = {
@@ -459,26 +797,57 @@ def main():
 
             # Only call LLM if OCR succeeded
             if not ocr_failed:
-                print(f"  🤖 Calling OpenAI {args.model}...")
-                llm_result = process_single_settlement(
-                    filing, text_content, openai_client, system_prompt
+                log(f"🤖 Calling OpenAI {args.model}...")
+                llm_result = await process_single_settlement(
+                    filing, text_content, openai_client, SYSTEM_PROMPT, rate_limiter, args.model, cache,
+                    token_usage
                 )
-                print(f"  ✓ Extracted: {llm_result.get('license_action', 'Unknown')} - Fine: ${llm_result.get('fine_amount', 0) or 0:,.0f}")
+                log(f"✓ Extracted: {llm_result.get('license_action', 'Unknown')} - Fine: ${llm_result.get('fine_amount', 0) or 0:,.0f}")
                 document["llm_extracted"] = llm_result
                 document["llm_model"] = args.model
 
-            # Upsert to MongoDB by pdf_url (one settlement per PDF)
-            settlements_collection.update_one(
-                {"pdf_url": pdf_url},
-                {"$set": document},
-                upsert=True
-            )
-            print(f"  💾 Stored in MongoDB")
-            processed += 1
+            # Queue upsert to MongoDB by pdf_url (one settlement per PDF)
+            pending_ops.append(UpdateOne({"pdf_url": pdf_url}, {"$set": document}, upsert=True))
+            log("💾 Queued for MongoDB")
+            return "processed"
 
         except Exception as e:
-            print(f"  ✗ Error: {e}")
-            errors += 1
+            log(f"✗ Error: {e}")
+            return "error"
+
+    async def process_all():
+        """
+        Drain the settlements with a fixed pool of workers, reporting progress as each finishes.
+
+        Only --concurrency filings are in flight at once, so at most that many text
+        files are held in memory (a task per settlement would read them all up front).
+        """
+        queue = asyncio.Queue()
+        for filing in settlements:
+            queue.put_nowait(filing)
+
+        async def worker():
+            while not queue.empty():
+                outcome = await process_filing(queue.get_nowait())
+                counts[outcome] += 1
+                # Flushed outside process_filing so a failed batch never counts against one filing
+                if len(pending_ops) >= BULK_WRITE_BATCH_SIZE:
+                    await flush_settlements()
+                finished = counts["processed"] + counts["skipped"] + counts["error"]
+                print(f"[{finished}/{len(settlements)}] {counts['processed']} processed, {counts['skipped']} skipped, {counts['error']} errors")
+
+        try:
+            await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        finally:
+            # Flush remaining upserts, including on Ctrl-C
+            if pending_ops:
+                count_write_failures(write_settlements(pending_ops))
+
+    print(f"\nProcessing {len(settlements)} settlements ({args.concurrency} concurrent requests, {args.rpm} RPM, {args.tpm} TPM)...")
+    asyncio.run(process_all())
+    processed = counts["processed"]
+    skipped = counts["skipped"]
+    errors = counts["error"]
 
     # Summary
     print("\n" + "=" * 50)
@@ -487,6 +856,11 @@ def main():
     print(f"Processed: {processed}")
     print(f"Skipped (no text file): {skipped}")
     print(f"Errors: {errors}")
+    if token_usage["prompt"]:
+        # The system prompt is a stable >1024-token prefix, so OpenAI caches it automatically
+        cached_pct = token_usage["cached"] / token_usage["prompt"] * 100
+        print(f"OpenAI tokens: {token_usage['prompt']:,} prompt ({token_usage['cached']:,} cached, {cached_pct:.0f}%), "
+              f"{token_usage['completion']:,} completion")
 
     if not args.dry_run:
         total_in_db = settlements_collection.count_documents({})
@@ -3,25 +3,61 @@ Scraper for Nevada Medical Board Public Filings (2008-2025)
 Downloads PDFs and extracts metadata from public malpractice filings.
 """
 
+import asyncio
 import json
 import time
 from pathlib import Path
 
 import httpx
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 BASE_URL = "https://medboard.nv.gov"
 YEARS = range(2008, 2026)  # 2008-2025 inclusive
-REQUEST_DELAY = 1.0  # seconds between requests
+REQUEST_DELAY = 1.0  # seconds between request starts
+MAX_CONCURRENT_REQUESTS = 10  # requests in flight at once (over one HTTP/2 connection)
 DATA_DIR = Path("data")
 PDF_DIR = Path("pdfs")
 
+# Only the filings list is built into a tree; the rest of the page is skipped
+FILINGS_LIST_STRAINER = SoupStrainer("ul", class_="main_list")
 
-def get_filings_page(year: int, client: httpx.Client) -> str:
+
+class RequestPacer:
+    """
+    Spaces request starts at least `delay` seconds apart across all tasks.
+
+    Unlike sleeping after each response, slow responses don't add to the delay,
+    so requests overlap while the overall request rate stays polite.
+    """
+
+    def __init__(self, delay: float, concurrency: int):
+        self.delay = delay
+        self.next_start = 0.0
+        self.lock = asyncio.Lock()
+        self.semaphore = asyncio.Semaphore(concurrency)
+
+    async def wait(self):
+        async with self.lock:
+            now = time.monotonic()
+            wait = self.next_start - now
+            self.next_start = max(now, self.next_start) + self.delay
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+async def fetch(url: str, client: httpx.AsyncClient, pacer: RequestPacer) -> httpx.Response:
+    """GET a URL (paced and concurrency-limited), raising on HTTP error status."""
+    async with pacer.semaphore:
+        await pacer.wait()
+        response = await client.get(url)
+    response.raise_for_status()
+    return response
+
+
+async def get_filings_page(year: int, client: httpx.AsyncClient, pacer: RequestPacer) -> str:
     """Fetch the public filings page for a given year."""
     url = f"{BASE_URL}/Resources/Public/{year}_Public_Filings/"
-    response = client.get(url)
-    response.raise_for_status()
+    response = await fetch(url, client, pacer)
     return response.text
 
 
@@ -57,7 +93,7 @@ def parse_title(title_text: str) -> dict:
 
 def parse_filings_page(html: str, year: int) -> list[dict]:
     """Parse the HTML page and extract filing metadata."""
-    soup = BeautifulSoup(html, "lxml")
+    soup = BeautifulSoup(html, "lxml", parse_only=FILINGS_LIST_STRAINER)
     filings = []
 
     main_list = soup.find("ul", class_="main_list")
@@ -100,7 +136,7 @@ def parse_filings_page(html: str, year: int) -> list[dict]:
     return filings
 
 
-def download_pdf(filing: dict, client: httpx.Client) -> bool:
+async def download_pdf(filing: dict, client: httpx.AsyncClient, pacer: RequestPacer) -> bool:
     """Download a PDF for a filing. Returns True if successful."""
     year = filing["year"]
     case_number = filing["case_number"] or "unknown"
@@ -120,10 +156,8 @@ def download_pdf(filing: dict, client: httpx.Client) -> bool:
         return True
 
     try:
-        response = client.get(filing["pdf_url"], follow_redirects=True)
-        response.raise_for_status()
-
-        pdf_path.write_bytes(response.content)
+        response = await fetch(filing["pdf_url"], client, pacer)
+        await asyncio.to_thread(pdf_path.write_bytes, response.content)
         print(f"    Downloaded: {filename}")
         return True
     except Exception as e:
@@ -131,36 +165,74 @@ def download_pdf(filing: dict, client: httpx.Client) -> bool:
         return False
 
 
-def scrape_all(download_pdfs: bool = True):
-    """Main scraping function."""
-    DATA_DIR.mkdir(exist_ok=True)
-    PDF_DIR.mkdir(exist_ok=True)
+async def download_all_pdfs(filings: list[dict], client: httpx.AsyncClient, pacer: RequestPacer):
+    """
+    Download the filings' PDFs with a fixed pool of MAX_CONCURRENT_REQUESTS workers.
+
+    Only that many downloads (and response bodies) are pending at once, and each
+    worker reports its files in order, unlike a task per filing created up front.
+    """
+    queue = asyncio.Queue()
+    for filing in filings:
+        queue.put_nowait(filing)
+
+    async def worker():
+        while not queue.empty():
+            await download_pdf(queue.get_nowait(), client, pacer)
+
+    await asyncio.gather(*(worker() for _ in range(MAX_CONCURRENT_REQUESTS)))
+
+
+async def scrape_year(
+    year: int,
+    client: httpx.AsyncClient,
+    pacer: RequestPacer,
+) -> tuple[list[dict], str | None]:
+    """Scrape one year's filings. Returns (filings, error message or None)."""
+    print(f"\nProcessing year {year}...")
+
+    try:
+        html = await get_filings_page(year, client, pacer)
+        filings = await asyncio.to_thread(parse_filings_page, html, year)
+        print(f"  Found {len(filings)} filings for {year}")
+        return filings, None
+
+    except Exception as e:
+        error_msg = f"Error processing year {year}: {e}"
+        print(f"  {error_msg}")
+        return [], error_msg
+
 
-    all_filings = []
-    errors = []
+async def scrape_years(download_pdfs: bool) -> tuple[list[dict], list[str]]:
+    """
+    Scrape all YEARS concurrently over one HTTP/2 client, then download their PDFs.
 
-    with httpx.Client(timeout=30.0, follow_redirects=True) as client:
-        for year in YEARS:
-            print(f"\nProcessing year {year}...")
+    Results keep YEARS order.
+    """
+    pacer = RequestPacer(REQUEST_DELAY, MAX_CONCURRENT_REQUESTS)
+    async with httpx.AsyncClient(
+        http2=True,
+        timeout=30.0,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=MAX_CONCURRENT_REQUESTS),
+    ) as client:
+        results = await asyncio.gather(*(scrape_year(year, client, pacer) for year in YEARS))
+        all_filings = [filing for filings, _ in results for filing in filings]
 
-            try:
-                html = get_filings_page(year, client)
-                filings = parse_filings_page(html, year)
-                print(f"  Found {len(filings)} filings")
+        if download_pdfs:
+            print(f"\nDownloading {len(all_filings)} PDFs ({MAX_CONCURRENT_REQUESTS} workers)...")
+            await download_all_pdfs(all_filings, client, pacer)
 
-                if download_pdfs:
-                    for filing in filings:
-                        download_pdf(filing, client)
-                        time.sleep(REQUEST_DELAY)
+    errors = [error for _, error in results if error]
+    return all_filings, errors
 
-                all_filings.extend(filings)
 
-            except Exception as e:
-                error_msg = f"Error processing year {year}: {e}"
-                print(f"  {error_msg}")
-                errors.append(error_msg)
+def scrape_all(download_pdfs: bool = True):
+    """Main scraping function."""
+    DATA_DIR.mkdir(exist_ok=True)
+    PDF_DIR.mkdir(exist_ok=True)
 
-            time.sleep(REQUEST_DELAY)
+    all_filings, errors = asyncio.run(scrape_years(download_pdfs))
 
     # Save metadata
     output_path = DATA_DIR / "filings.json"
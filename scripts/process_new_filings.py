@@ -15,28 +15,40 @@ Usage:
     uv run python scripts/process_new_filings.py              # Check current + previous year
     uv run python scripts/process_new_filings.py --dry-run    # Preview without processing
     uv run python scripts/process_new_filings.py --all-years  # Check all years (2008-present)
+    uv run python scripts/process_new_filings.py --full-scan  # Rebuild the local pdf_url cache
 """
 
 import argparse
+import functools
+import json
 import os
 import re
 import sys
 import tempfile
+import threading
 import time
-from datetime import datetime
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
 from pathlib import Path
+from urllib.parse import urljoin
 
 import httpx
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from dotenv import load_dotenv
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne
+from pymongo.errors import BulkWriteError, OperationFailure
 
 # Add scripts directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
 from process_single_file import (
+    BULK_WRITE_BATCH_SIZE,
+    OCR_JOBS,
     process_single_file,
     classify_document_type,
+    get_openai_client,
+    write_deferred,
 )
 
 load_dotenv()
@@ -47,21 +59,139 @@ load_dotenv()
 
 BASE_URL = "https://medboard.nv.gov"
 REQUEST_DELAY = 1.0  # seconds between requests
+LLM_CONCURRENCY = int(os.environ.get("LLM_CONCURRENCY", "4"))  # concurrent pipeline workers
+
+# Only the filings list is built into a tree; the rest of the page is skipped
+FILINGS_LIST_STRAINER = SoupStrainer("ul", class_="main_list")
+
+# "Case No 24-12345-1" or "License No 10534" in a single scan
+CASE_OR_LICENSE_PATTERN = re.compile(
+    r"^(?:case no\s+(?P<case>.+)|license no\.?\s*(?P<license>[A-Za-z]*\d+))",
+    re.IGNORECASE,
+)
+
+# Local cache of pdf_urls already in MongoDB (incrementally refreshed each run by
+# processed_at, and rebuilt from a full scan once it is older than the max age)
+SEEN_URLS_CACHE_FILE = Path(tempfile.gettempdir()) / "seen_pdf_urls.json"
+SEEN_URLS_CACHE_OVERLAP = 3600  # seconds re-scanned before the last run's timestamp
+SEEN_URLS_CACHE_MAX_AGE = 7 * 24 * 3600  # seconds between full scans
+
+# pdf_url index hinted on full-scan fallbacks, by name (see create_indexes.py):
+# settlements also has a partial index on pdf_url, so a key-pattern hint is ambiguous
+PDF_URL_INDEXES = {
+    "complaints": "pdf_url_idx",
+    "settlements": "pdf_url_1",
+    "license_only_filings": "pdf_url_unique",
+}
+
+# Retry settings for transient HTTP failures (rate limits, 5xx, timeouts)
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 1.0  # seconds, doubled after each attempt (1s -> 2s -> 4s)
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+# -----------------------------------------------------------------------------
+# HTTP Helpers
+# -----------------------------------------------------------------------------
+
+def is_transient_error(error: Exception) -> bool:
+    """Check if an HTTP error is worth retrying (rate limit, server error, network)."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(error, (httpx.TimeoutException, httpx.TransportError))
+
+
+def get_retry_delay(error: Exception, attempt: int) -> float:
+    """Seconds to wait before the next attempt, honoring Retry-After on 429s."""
+    if isinstance(error, httpx.HTTPStatusError) and error.response.status_code == 429:
+        retry_after = error.response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return float(retry_after)
+    return RETRY_BASE_DELAY * (2 ** attempt)
+
+
+def with_retries(func):
+    """Retry a function on transient HTTP errors with exponential backoff."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                if attempt == MAX_RETRIES or not is_transient_error(e):
+                    raise
+                delay = get_retry_delay(e, attempt)
+                print(f"    Transient error ({e}), retrying in {delay:.0f}s...")
+                time.sleep(delay)
+    return wrapper
+
+
+def create_http_client() -> httpx.Client:
+    """Create a pooled HTTP/2 client shared by the scrape and download steps."""
+    return httpx.Client(
+        timeout=30.0,
+        follow_redirects=True,
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+    )
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket limiting how often requests are made.
+
+    Tokens refill at `rate` per second up to `capacity`; each acquire() takes one
+    token, blocking until one is available. Shared by all callers, so politeness
+    to the remote host is global rather than per loop.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+            if self.tokens < 1:
+                time.sleep((1 - self.tokens) / self.rate)
+                self.tokens = 1.0
+                self.updated = time.monotonic()
+
+            self.tokens -= 1
+
+
+# All requests to medboard.nv.gov share one bucket (1 request per REQUEST_DELAY)
+MEDBOARD_RATE_LIMITER = RateLimiter(rate=1 / REQUEST_DELAY)
+
+
+@with_retries
+def fetch_url(url: str, client: httpx.Client) -> httpx.Response:
+    """GET a URL and raise on HTTP error status. Rate limited; retries transient failures."""
+    MEDBOARD_RATE_LIMITER.acquire()
+    response = client.get(url, follow_redirects=True)
+    response.raise_for_status()
+    return response
 
 
 # -----------------------------------------------------------------------------
 # Scraping Functions (from scraper.py)
 # -----------------------------------------------------------------------------
 
+def get_filings_page_url(year: int) -> str:
+    """URL of the public filings page for a given year."""
+    return f"{BASE_URL}/Resources/Public/{year}_Public_Filings/"
+
+
 def get_filings_page(year: int, client: httpx.Client) -> str | None:
     """Fetch the public filings page for a given year. Returns None if page doesn't exist."""
-    url = f"{BASE_URL}/Resources/Public/{year}_Public_Filings/"
     try:
-        response = client.get(url)
-        if response.status_code == 404:
-            return None
-        response.raise_for_status()
-        return response.text
+        return fetch_url(get_filings_page_url(year), client).text
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             return None
@@ -79,16 +209,16 @@ def normalize_case_number(case_info: str) -> str:
     """
     case_info = case_info.strip()
 
+    match = CASE_OR_LICENSE_PATTERN.match(case_info)
+    if not match:
+        return case_info
+
     # Handle "Case No" prefix
-    if case_info.lower().startswith("case no "):
-        return case_info[8:].strip()
+    if match.group("case"):
+        return match.group("case").strip()
 
     # Handle "License No" format - convert to LICENSE-XXXX
-    license_match = re.match(r'License No\.?\s*([A-Za-z]*\d+)', case_info, re.IGNORECASE)
-    if license_match:
-        return f"LICENSE-{license_match.group(1)}"
-
-    return case_info
+    return f"LICENSE-{match.group('license')}"
 
 
 def parse_title(title_text: str) -> dict:
@@ -115,14 +245,24 @@ def parse_title(title_text: str) -> dict:
     }
 
 
-def parse_filings_page(html: str, year: int) -> list[dict]:
-    """Parse the HTML page and extract filing metadata."""
-    soup = BeautifulSoup(html, "lxml")
+def parse_filings_page(html: str, year: int) -> tuple[list[dict], list[dict]]:
+    """
+    Parse the HTML page and extract filing metadata.
+
+    Filings are classified as they are parsed so that ignored document types
+    never reach the MongoDB check or download steps.
+
+    Returns:
+        (processable_filings, ignored_filings)
+    """
+    soup = BeautifulSoup(html, "lxml", parse_only=FILINGS_LIST_STRAINER)
+    page_url = get_filings_page_url(year)
     filings = []
+    ignored = []
 
     main_list = soup.find("ul", class_="main_list")
     if not main_list:
-        return filings
+        return filings, ignored
 
     for li in main_list.find_all("li"):
         date_div = li.find("div", class_="main_list_date")
@@ -148,32 +288,64 @@ def parse_filings_page(html: str, year: int) -> list[dict]:
             "type": parsed["type"],
             "respondent": parsed["respondent"],
             "case_number": parsed["case_number"],
-            "pdf_url": BASE_URL + href if href.startswith("/") else href,
+            "pdf_url": urljoin(page_url, href),
         }
+
+        doc_class = classify_document_type(filing["type"], filing["case_number"])
+        if doc_class == "ignored":
+            ignored.append(filing)
+            continue
+
+        filing["_classification"] = doc_class
         filings.append(filing)
 
-    return filings
+    return filings, ignored
 
 
-def scrape_years(years: list[int], client: httpx.Client) -> list[dict]:
-    """Scrape filings for the given years."""
+def scrape_years(years: list[int], client: httpx.Client) -> tuple[list[dict], list[dict]]:
+    """
+    Scrape filings for the given years. Returns (processable_filings, ignored_filings).
+
+    Pages are fetched sequentially (rate limited), then parsed in a process pool
+    since BeautifulSoup parsing is CPU-bound.
+    """
     all_filings = []
+    all_ignored = []
 
+    pages = []
     for year in years:
-        print(f"  Scraping {year}...", end=" ")
+        print(f"  Fetching {year}...", end=" ")
 
         html = get_filings_page(year, client)
         if html is None:
             print("page not found")
             continue
 
-        filings = parse_filings_page(html, year)
-        print(f"found {len(filings)} filings")
+        print("done")
+        pages.append((year, html))
+
+    if not pages:
+        return all_filings, all_ignored
+
+    htmls = [html for _, html in pages]
+    page_years = [year for year, _ in pages]
+    with ProcessPoolExecutor(max_workers=min(len(pages), os.cpu_count() or 1)) as executor:
+        parsed_pages = list(executor.map(parse_filings_page, htmls, page_years))
+
+    for year, (filings, ignored) in zip(page_years, parsed_pages):
+        print(f"  {year}: found {len(filings)} processable filings ({len(ignored)} ignored)")
         all_filings.extend(filings)
+        all_ignored.extend(ignored)
+
+    return all_filings, all_ignored
 
-        time.sleep(REQUEST_DELAY)
 
-    return all_filings
+def dedupe_by_pdf_url(filings: list[dict]) -> list[dict]:
+    """Drop filings whose pdf_url was already seen, keeping the first occurrence."""
+    unique = {}
+    for filing in filings:
+        unique.setdefault(filing["pdf_url"], filing)
+    return list(unique.values())
 
 
 # -----------------------------------------------------------------------------
@@ -188,45 +360,174 @@ def get_mongo_client() -> MongoClient:
     return MongoClient(mongo_uri)
 
 
-def get_existing_pdf_urls(db) -> set[str]:
-    """Get all pdf_urls that already exist in the database."""
-    existing = set()
+def load_seen_urls_cache() -> dict:
+    """Load the pdf_url cache from a previous run. Returns an empty cache if missing or corrupt."""
+    try:
+        cache = json.loads(SEEN_URLS_CACHE_FILE.read_text())
+        return {
+            "ts": float(cache["ts"]),
+            "full_scan_ts": float(cache["full_scan_ts"]),
+            "urls": set(cache["urls"]),
+        }
+    except (OSError, ValueError, KeyError, TypeError):
+        return {"ts": 0.0, "full_scan_ts": 0.0, "urls": set()}
+
+
+def save_seen_urls_cache(cache: dict) -> None:
+    """Persist the pdf_url cache. Best-effort: ephemeral filesystems may not keep it."""
+    try:
+        SEEN_URLS_CACHE_FILE.write_text(json.dumps({
+            "ts": cache["ts"],
+            "full_scan_ts": cache["full_scan_ts"],
+            "urls": sorted(cache["urls"]),
+        }))
+    except OSError as e:
+        print(f"  Warning: could not write pdf_url cache: {e}")
+
+
+def distinct_pdf_urls(collection, query: dict) -> list[str]:
+    """
+    Get distinct pdf_urls matching a query, deduplicated server-side.
+
+    If the distinct result exceeds MongoDB's 16MB document limit, falls back to
+    streaming pdf_url-only documents in large batches (index-only on full scans).
+    """
+    try:
+        return collection.distinct("pdf_url", query, comment="dedup_check")
+    except OperationFailure:
+        cursor = (
+            collection.find({**query, "pdf_url": {"$exists": True}}, {"_id": 0, "pdf_url": 1})
+            .batch_size(5000)
+            .comment("dedup_check")
+        )
+        if not query and collection.name in PDF_URL_INDEXES:
+            cursor = cursor.hint(PDF_URL_INDEXES[collection.name])
+        return [doc["pdf_url"] for doc in cursor]
+
+
+def get_existing_pdf_urls(db, full_scan: bool = False) -> dict:
+    """
+    Get all pdf_urls that already exist in the database.
+
+    URLs seen on a previous run are loaded from a local cache, and only documents
+    processed since that run (by processed_at, which every upsert sets) are fetched
+    from MongoDB, so amended complaints that kept their _id are picked up too. Falls
+    back to a full scan when there is no cache, when the last full scan is older than
+    SEEN_URLS_CACHE_MAX_AGE (dropping deleted or rewritten URLs), or on `full_scan`.
 
-    # Get from complaints collection
-    for doc in db["complaints"].find({}, {"pdf_url": 1}):
-        if doc.get("pdf_url"):
-            existing.add(doc["pdf_url"])
+    Returns:
+        The refreshed cache ({"ts", "full_scan_ts", "urls"}). The caller saves it
+        with save_seen_urls_cache once the run's own writes are done.
+    """
+    cache = load_seen_urls_cache()
+    query_started = time.time()
 
-    # Get from settlements collection
-    for doc in db["settlements"].find({}, {"pdf_url": 1}):
-        if doc.get("pdf_url"):
-            existing.add(doc["pdf_url"])
+    if full_scan or not cache["ts"] or query_started - cache["full_scan_ts"] > SEEN_URLS_CACHE_MAX_AGE:
+        query = {}
+        cache = {"ts": query_started, "full_scan_ts": query_started, "urls": set()}
+        print("  Running a full pdf_url scan")
+    else:
+        # Overlap the previous run slightly to tolerate clock skew with the server
+        since = datetime.fromtimestamp(cache["ts"] - SEEN_URLS_CACHE_OVERLAP, timezone.utc)
+        query = {"processed_at": {"$gte": since}}
+        cache["ts"] = query_started
+        print(f"  Loaded {len(cache['urls'])} cached URLs, fetching documents processed since {since.isoformat()}")
 
-    # Get from license_only_filings collection
-    for doc in db["license_only_filings"].find({}, {"pdf_url": 1}):
-        if doc.get("pdf_url"):
-            existing.add(doc["pdf_url"])
+    for collection_name in ["complaints", "settlements", "license_only_filings"]:
+        cache["urls"].update(url for url in distinct_pdf_urls(db[collection_name], query) if url)
 
-    return existing
+    return cache
+
+
+def track_ignored_filings(db, ignored_filings: list[dict]) -> None:
+    """
+    Record ignored (non-processable) filings in the ignored_filings collection.
+
+    Uses a single unordered bulk upsert keyed on pdf_url; existing entries are left
+    untouched. Failures are logged but don't fail the run.
+    """
+    if not ignored_filings:
+        return
+
+    now = datetime.now(timezone.utc)
+    operations = [
+        UpdateOne(
+            {"pdf_url": f["pdf_url"]},
+            {"$setOnInsert": {
+                "pdf_url": f["pdf_url"],
+                "type": f["type"],
+                "case_number": f["case_number"],
+                "year": f["year"],
+                "date": f["date"],
+                "seen_at": now,
+            }},
+            upsert=True,
+        )
+        for f in ignored_filings
+    ]
+
+    try:
+        result = db["ignored_filings"].bulk_write(operations, ordered=False)
+        print(f"  Tracked ignored filings: {result.upserted_count} new")
+    except BulkWriteError as e:
+        print(f"  Warning: failed to track some ignored filings: {e.details.get('writeErrors', [])[:1]}")
 
 
 # -----------------------------------------------------------------------------
 # Download Functions
 # -----------------------------------------------------------------------------
 
+class _SanitizeTable(dict):
+    """str.translate table mapping anything but alphanumerics, '-' and '_' to '_'."""
+
+    def __missing__(self, codepoint: int) -> str:
+        char = chr(codepoint)
+        self[codepoint] = char if char.isalnum() or char in "-_" else "_"
+        return self[codepoint]
+
+
+FILENAME_SANITIZE_TABLE = _SanitizeTable()
+
+
+@with_retries
+def stream_pdf_to_file(url: str, client: httpx.Client, pdf_path: Path) -> bool:
+    """
+    Stream a PDF to disk. Rate limited; retries transient failures.
+
+    The first chunk is checked for the %PDF magic bytes before anything is written,
+    so HTML error pages are discarded without touching disk. Returns False if the
+    response is not a PDF.
+    """
+    MEDBOARD_RATE_LIMITER.acquire()
+    with client.stream("GET", url, follow_redirects=True) as response:
+        response.raise_for_status()
+        chunks = response.iter_bytes(chunk_size=65536)
+
+        first_chunk = next(chunks, b"")
+        if not first_chunk.startswith(b"%PDF"):
+            return False
+
+        with open(pdf_path, "wb") as f:
+            f.write(first_chunk)
+            for chunk in chunks:
+                f.write(chunk)
+
+    return True
+
+
 def download_pdf_to_temp(filing: dict, client: httpx.Client, temp_dir: Path) -> Path | None:
     """Download a PDF to a temp directory. Returns the path or None on failure."""
     case_number = filing["case_number"] or "unknown"
-    safe_case = "".join(c if c.isalnum() or c in "-_" else "_" for c in case_number)
-    safe_type = "".join(c if c.isalnum() or c in "-_" else "_" for c in filing["type"][:30])
+    safe_case = case_number.translate(FILENAME_SANITIZE_TABLE)
+    safe_type = filing["type"][:30].translate(FILENAME_SANITIZE_TABLE)
     filename = f"{safe_case}_{safe_type}.pdf"
 
     pdf_path = temp_dir / filename
 
     try:
-        response = client.get(filing["pdf_url"], follow_redirects=True)
-        response.raise_for_status()
-        pdf_path.write_bytes(response.content)
+        if not stream_pdf_to_file(filing["pdf_url"], client, pdf_path):
+            print(f"    Error downloading: response is not a PDF")
+            return None
         return pdf_path
     except Exception as e:
         print(f"    Error downloading: {e}")
@@ -241,6 +542,7 @@ def process_new_filings(
     years: list[int] | None = None,
     dry_run: bool = False,
     model: str = "gpt-4o",
+    full_scan: bool = False,
 ) -> dict:
     """
     Main function to scrape and process new filings.
@@ -249,6 +551,7 @@ def process_new_filings(
         years: List of years to check. Defaults to current + previous year.
         dry_run: If True, don't download or process, just show what would be done.
         model: OpenAI model to use for extraction.
+        full_scan: If True, rebuild the local pdf_url cache from a full MongoDB scan.
 
     Returns:
         dict with summary of results.
@@ -265,89 +568,90 @@ def process_new_filings(
     print(f"Dry run: {dry_run}")
     print(f"Time: {datetime.now().isoformat()}")
 
-    # Step 1: Scrape filings from website
-    print(f"\nStep 1: Scraping filings...")
-    with httpx.Client(timeout=30.0, follow_redirects=True) as client:
-        all_filings = scrape_years(years, client)
-
-    print(f"  Total filings found: {len(all_filings)}")
-
-    if not all_filings:
-        print("\nNo filings found. Exiting.")
-        return {"status": "no_filings", "total_found": 0}
-
-    # Step 2: Check MongoDB for existing filings
-    print(f"\nStep 2: Checking MongoDB for existing filings...")
-    mongo_client = get_mongo_client()
-    db = mongo_client["malpractice"]
-    existing_urls = get_existing_pdf_urls(db)
-    print(f"  Existing filings in DB: {len(existing_urls)}")
-
-    # Step 3: Filter to new filings only
-    new_filings = [f for f in all_filings if f["pdf_url"] not in existing_urls]
-
-    # Also filter out ignored document types
-    processable_filings = []
-    ignored_filings = []
-    for filing in new_filings:
-        doc_class = classify_document_type(filing["type"], filing.get("case_number", ""))
-        if doc_class == "ignored":
-            ignored_filings.append(filing)
-        else:
-            filing["_classification"] = doc_class
-            processable_filings.append(filing)
-
-    print(f"\nStep 3: Filtering...")
-    print(f"  New filings: {len(new_filings)}")
-    print(f"  Processable (complaint/settlement/license_only): {len(processable_filings)}")
-    print(f"  Ignored (other orders, etc.): {len(ignored_filings)}")
-
-    if not processable_filings:
-        print("\nNo new processable filings. Exiting.")
-        return {
-            "status": "no_new_filings",
-            "total_found": len(all_filings),
-            "already_processed": len(all_filings) - len(new_filings),
-            "ignored": len(ignored_filings),
-        }
-
-    # Show what we'll process
-    print(f"\nNew filings to process:")
-    for f in processable_filings[:10]:
-        print(f"  - [{f['_classification']}] {f['case_number']}: {f['type'][:50]}")
-    if len(processable_filings) > 10:
-        print(f"  ... and {len(processable_filings) - 10} more")
-
-    if dry_run:
-        print(f"\n[DRY RUN] Would process {len(processable_filings)} filings")
-        return {
-            "status": "dry_run",
-            "total_found": len(all_filings),
-            "new_filings": len(processable_filings),
-            "ignored": len(ignored_filings),
+    # One long-lived HTTP client for scraping and downloading, so TLS
+    # connections to medboard.nv.gov are reused across all requests
+    with create_http_client() as client:
+        # Step 1: Scrape filings from website
+        print(f"\nStep 1: Scraping filings...")
+        all_filings, ignored_filings = scrape_years(years, client)
+
+        # Same PDF can be listed more than once (re-posted or under multiple years)
+        scraped_count = len(all_filings)
+        all_filings = dedupe_by_pdf_url(all_filings)
+        ignored_filings = dedupe_by_pdf_url(ignored_filings)
+        if len(all_filings) < scraped_count:
+            print(f"  Deduplicated to {len(all_filings)} unique URLs (from {scraped_count})")
+
+        print(f"  Total processable filings found: {len(all_filings)}")
+        print(f"  Ignored (other orders, etc.): {len(ignored_filings)}")
+
+        if not all_filings:
+            print("\nNo processable filings found. Exiting.")
+            return {"status": "no_filings", "total_found": 0, "ignored": len(ignored_filings)}
+
+        # Step 2: Check MongoDB for existing filings
+        print(f"\nStep 2: Checking MongoDB for existing filings...")
+        mongo_client = get_mongo_client()
+        db = mongo_client["malpractice"]
+        seen_urls = get_existing_pdf_urls(db, full_scan=full_scan)
+        existing_urls = seen_urls["urls"]
+        print(f"  Existing filings in DB: {len(existing_urls)}")
+
+        # Step 3: Filter to new filings only (ignored types were dropped while scraping)
+        new_filings = [f for f in all_filings if f["pdf_url"] not in existing_urls]
+
+        print(f"\nStep 3: Filtering...")
+        print(f"  New processable filings (complaint/settlement/license_only): {len(new_filings)}")
+
+        if not dry_run:
+            track_ignored_filings(db, ignored_filings)
+
+        if not new_filings:
+            print("\nNo new processable filings. Exiting.")
+            save_seen_urls_cache(seen_urls)
+            return {
+                "status": "no_new_filings",
+                "total_found": len(all_filings),
+                "already_processed": len(all_filings) - len(new_filings),
+                "ignored": len(ignored_filings),
+            }
+
+        # Show what we'll process
+        print(f"\nNew filings to process:")
+        for f in new_filings[:10]:
+            print(f"  - [{f['_classification']}] {f['case_number']}: {f['type'][:50]}")
+        if len(new_filings) > 10:
+            print(f"  ... and {len(new_filings) - 10} more")
+
+        if dry_run:
+            print(f"\n[DRY RUN] Would process {len(new_filings)} filings")
+            save_seen_urls_cache(seen_urls)
+            return {
+                "status": "dry_run",
+                "total_found": len(all_filings),
+                "new_filings": len(new_filings),
+                "ignored": len(ignored_filings),
+            }
+
+        # Step 4: Process each new filing
+        print(f"\nStep 4: Processing {len(new_filings)} new filings...")
+
+        results = {
+            "success": [],
+            "failed": [],
+            "errors": [],
         }
 
-    # Step 4: Process each new filing
-    print(f"\nStep 4: Processing {len(processable_filings)} new filings...")
-
-    results = {
-        "success": [],
-        "failed": [],
-        "errors": [],
-    }
-
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
 
-        with httpx.Client(timeout=30.0, follow_redirects=True) as client:
-            for i, filing in enumerate(processable_filings, 1):
+            # Download all PDFs first (throttled by the medboard.nv.gov rate limiter)
+            downloaded = []
+            for i, filing in enumerate(new_filings, 1):
                 case_number = filing["case_number"]
                 doc_type = filing["type"]
 
-                print(f"\n[{i}/{len(processable_filings)}] {case_number}: {doc_type[:40]}...")
-
-                # Download PDF
-                print(f"  Downloading...")
+                print(f"\n[{i}/{len(new_filings)}] Downloading {case_number}: {doc_type[:40]}...")
                 pdf_path = download_pdf_to_temp(filing, client, temp_path)
 
                 if not pdf_path:
@@ -359,21 +663,74 @@ def process_new_filings(
                     continue
 
                 print(f"  Downloaded: {pdf_path.name}")
-
-                # Process through pipeline (pass scraped metadata for date, respondent, etc.)
-                try:
-                    result = process_single_file(
+                downloaded.append((pdf_path, filing))
+
+            # Process through pipeline concurrently to overlap LLM and MongoDB I/O
+            # (pass scraped metadata for date, respondent, etc.). Workers share one
+            # MongoDB/OpenAI client; settlement and license-only upserts are
+            # collected and written with bulk_write.
+            print(f"\nProcessing {len(downloaded)} downloaded filings ({LLM_CONCURRENCY} workers)...")
+            openai_client = get_openai_client()
+            pending_writes = defaultdict(list)  # collection -> (pdf_url, op)
+
+            def flush_writes():
+                # A filing only counts as a success once its deferred upsert is written
+                failed_writes = write_deferred(db, pending_writes)
+                if not failed_writes:
+                    return
+                stored = []
+                for entry in results["success"]:
+                    if entry["pdf_url"] in failed_writes:
+                        results["errors"].append({
+                            "case_number": entry["case_number"],
+                            "error": f"MongoDB write failed: {failed_writes[entry['pdf_url']]}",
+                        })
+                    else:
+                        stored.append(entry)
+                results["success"] = stored
+
+            # Pipeline workers share the cores, so each OCRs only its share of pages at once
+            ocr_jobs = max(1, OCR_JOBS // LLM_CONCURRENCY)
+            with ThreadPoolExecutor(max_workers=LLM_CONCURRENCY) as executor:
+                futures = {
+                    executor.submit(
+                        process_single_file,
                         pdf_path=pdf_path,
                         output_dir=temp_path,
                         dry_run=False,
                         model=model,
                         filing_metadata=filing,
-                    )
+                        db=db,
+                        openai_client=openai_client,
+                        defer_write=True,
+                        ocr_jobs=ocr_jobs,
+                    ): filing
+                    for pdf_path, filing in downloaded
+                }
+
+                for future in as_completed(futures):
+                    filing = futures[future]
+                    case_number = filing["case_number"]
+
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        print(f"  Error processing {case_number}: {e}")
+                        results["errors"].append({
+                            "case_number": case_number,
+                            "error": str(e),
+                        })
+                        continue
+
+                    if "write" in result:
+                        collection_name, op = result.pop("write")
+                        pending_writes[collection_name].append((filing["pdf_url"], op))
 
                     if result.get("status") == "success":
                         results["success"].append({
                             "case_number": case_number,
-                            "type": doc_type,
+                            "pdf_url": filing["pdf_url"],
+                            "type": filing["type"],
                             "classification": result.get("classification"),
                         })
                     else:
@@ -382,15 +739,14 @@ def process_new_filings(
                             "error": result.get("error", "Unknown error"),
                         })
 
-                except Exception as e:
-                    print(f"  Error: {e}")
-                    results["errors"].append({
-                        "case_number": case_number,
-                        "error": str(e),
-                    })
+                    if sum(map(len, pending_writes.values())) >= BULK_WRITE_BATCH_SIZE:
+                        flush_writes()
+
+            flush_writes()
 
-                # Brief delay between filings
-                time.sleep(REQUEST_DELAY)
+        # Cache this run's stored URLs too, so they are skipped next run
+        existing_urls.update(f["pdf_url"] for f in results["success"])
+        save_seen_urls_cache(seen_urls)
 
     # Summary
     print(f"\n{'='*60}")
@@ -398,7 +754,7 @@ def process_new_filings(
     print(f"{'='*60}")
     print(f"Total filings found: {len(all_filings)}")
     print(f"Already in database: {len(all_filings) - len(new_filings)}")
-    print(f"New filings processed: {len(processable_filings)}")
+    print(f"New filings processed: {len(new_filings)}")
     print(f"  - Success: {len(results['success'])}")
     print(f"  - Failed: {len(results['failed'])}")
     print(f"  - Errors: {len(results['errors'])}")
@@ -418,7 +774,7 @@ def process_new_filings(
         "status": "completed",
         "total_found": len(all_filings),
         "already_processed": len(all_filings) - len(new_filings),
-        "new_processed": len(processable_filings),
+        "new_processed": len(new_filings),
         "success": len(results["success"]),
         "failed": len(results["failed"]),
         "errors": len(results["errors"]),
@@ -436,6 +792,7 @@ Examples:
     uv run python scripts/process_new_filings.py --dry-run    # Preview only
     uv run python scripts/process_new_filings.py --all-years  # All years (2008-present)
     uv run python scripts/process_new_filings.py --years 2024 2025
+    uv run python scripts/process_new_filings.py --full-scan  # Rebuild pdf_url cache
         """
     )
     parser.add_argument(
@@ -460,6 +817,11 @@ Examples:
         default="gpt-4o",
         help="OpenAI model to use (default: gpt-4o)"
     )
+    parser.add_argument(
+        "--full-scan",
+        action="store_true",
+        help="Ignore the local pdf_url cache and rebuild it from a full MongoDB scan"
+    )
 
     args = parser.parse_args()
 
@@ -476,10 +838,11 @@ Examples:
         years=years,
         dry_run=args.dry_run,
         model=args.model,
+        full_scan=args.full_scan,
     )
 
-    # Exit with appropriate code
-    if result.get("status") in ["completed", "dry_run", "no_filings", "no_new_filings"]:
+    # Exit with appropriate code (errors include filings whose MongoDB write failed)
+    if result.get("status") in ["completed", "dry_run", "no_filings", "no_new_filings"] and not result.get("errors"):
         sys.exit(0)
     else:
         sys.exit(1)
@@ -19,9 +19,12 @@ Usage:
     uv run python scripts/process_single_file.py path/to/file.pdf
     uv run python scripts/process_single_file.py path/to/file.pdf --dry-run
     uv run python scripts/process_single_file.py path/to/file.pdf --skip-ocr  # If text already exists
+    uv run python scripts/process_single_file.py --batch path/to/dir          # Every PDF in a directory
 """
 
 import argparse
+import hashlib
+import io
 import json
 import os
 import re
@@ -29,14 +32,19 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import threading
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
 from dotenv import load_dotenv
 from openai import OpenAI
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne
+from pymongo.collection import Collection
+from pymongo.errors import BulkWriteError, DuplicateKeyError, PyMongoError
 
 load_dotenv()
 
@@ -47,12 +55,40 @@ load_dotenv()
 PROJECT_ROOT = Path(__file__).parent.parent
 PROMPTS_DIR = Path(__file__).parent / "prompts"
 
+# Number of deferred upserts queued by process_files before a bulk_write flush
+BULK_WRITE_BATCH_SIZE = 100
+
+# Max concurrent OpenAI requests for the chunks of one large settlement
+MAX_CHUNK_CONCURRENCY = 8
+
+# Prepared (OCR'd) files allowed to wait for the LLM stage in process_files
+PIPELINE_BACKLOG = 16
+
+# Short documents extracted together in one LLM request by process_files
+BATCH_PROMPT_MAX_DOCS = 8
+BATCH_PROMPT_MAX_CHARS = 60000     # Total document text per batched request
+BATCH_PROMPT_DOC_MAX_CHARS = 8000  # Longer documents get a request of their own
+
+# Appended to the system prompt when several documents share one request
+BATCH_PROMPT_INSTRUCTIONS = """
+
+## Multiple Documents
+
+The user message is a JSON array of documents, each with an "id" and its "content".
+Extract each document independently, exactly as if it were sent alone, and respond with:
+{"results": [{"id": <document id>, "extraction": <the JSON object for that document>}]}
+Include one entry per input document.
+"""
+
 # License-only case number pattern (e.g., LICENSE-401, LICENSE-3298)
 LICENSE_ONLY_PATTERN = re.compile(r"^LICENSE-\d+$", re.IGNORECASE)
 
 # Case number normalization pattern (strips leading zeros from suffix)
 LEADING_ZERO_PATTERN = re.compile(r"^(\d+-\d+)-0+(\d+)$")
 
+# Two-digit year prefix of a case number (e.g., "24" in 24-12345-1)
+YEAR_PREFIX_PATTERN = re.compile(r"^(\d{2})-")
+
 # Document type classification
 COMPLAINT_TYPES = {
     "Complaint": 1,
@@ -63,7 +99,7 @@ COMPLAINT_TYPES = {
     "Third Amended Complaint": 4,
 }
 
-SETTLEMENT_TYPES = [
+SETTLEMENT_TYPES = (
     # Primary settlement types
     "Settlement Agreement and Order",
     "Settlement, Waiver and Consent Agreement",
@@ -90,7 +126,8 @@ SETTLEMENT_TYPES = [
     "Findings of Fact, Conclusions of Law, and Order",
     "Amended Findings of Fact, Conclusions of Law and Order",
     "Findings of Fact, Conclustions of Law and Order",  # Typo in source data
-]
+)
+SETTLEMENT_TYPE_SET = frozenset(SETTLEMENT_TYPES)
 
 # OCR text cleaning patterns
 CLEANING_PATTERNS = {
@@ -105,6 +142,38 @@ CLEANING_PATTERNS = {
     "exhibit_number_only": re.compile(r"^\s*\d\s*$"),
 }
 
+# All cleaning patterns as one alternation (tried in the same order); the
+# matching group name is the removal reason
+COMBINED_CLEANING_PATTERN = re.compile("|".join(
+    f"(?P<{name}>(?i:{pattern.pattern}))" if pattern.flags & re.IGNORECASE else f"(?P<{name}>{pattern.pattern})"
+    for name, pattern in CLEANING_PATTERNS.items()
+))
+
+
+# Substrings typical of OCR'd margin line numbers (see is_gibberish_line)
+GIBBERISH_INDICATORS = (
+    "WwW", "wWw", "Ww", "wW", "Bw", "wB", "BW",
+    "ND", "YN", "NH", "NM", "FB", "FF", "FW",
+    "eB", "Be", "eH", "mw", "mn", "nn", "fF", "Ff",
+    "Se", "Oe", "oO", "HD", "SS", "DAH", "DAW", "UDF",
+)
+
+# Merge policy for settlement fields extracted from multiple chunks
+# (see merge_extraction_results): first truthy value wins / true if any chunk says so
+MERGE_FIRST_VALUE_FIELDS = (
+    "license_action",
+    "probation_months",
+    "ineligible_to_reapply_months",
+    "fine_amount",
+    "investigation_costs",
+    "charity_donation",
+    "costs_payment_deadline_days",
+    "cme_hours",
+    "cme_topic",
+    "cme_deadline_months",
+)
+MERGE_ANY_TRUE_FIELDS = ("costs_stayed", "public_reprimand", "npdb_report")
+
 
 # -----------------------------------------------------------------------------
 # Document Type Detection
@@ -134,7 +203,8 @@ def fix_case_number_format(case_number: str) -> str:
         return case_number
 
     # Remove stuck 'pdf' suffix
-    case_number = re.sub(r"pdf$", "", case_number, flags=re.IGNORECASE)
+    if case_number[-3:].lower() == "pdf":
+        case_number = case_number[:-3]
 
     # Strip leading zeros from doc number: XX-XXXXX-01 -> XX-XXXXX-1
     case_number = LEADING_ZERO_PATTERN.sub(r"\1-\2", case_number)
@@ -142,6 +212,7 @@ def fix_case_number_format(case_number: str) -> str:
     return case_number
 
 
+@lru_cache(maxsize=8192)
 def classify_document_type(doc_type: str, case_number: str = "") -> str:
     """
     Classify a document as 'complaint', 'settlement', 'license_only', or 'ignored'.
@@ -162,9 +233,8 @@ def classify_document_type(doc_type: str, case_number: str = "") -> str:
         return "complaint"
 
     # Check if it's a settlement type (exact match or prefix match)
-    for settlement_type in SETTLEMENT_TYPES:
-        if doc_type == settlement_type or doc_type.startswith(settlement_type):
-            return "settlement"
+    if doc_type in SETTLEMENT_TYPE_SET or doc_type.startswith(SETTLEMENT_TYPES):
+        return "settlement"
 
     return "ignored"
 
@@ -179,7 +249,14 @@ def parse_filename(filepath: Path) -> dict:
 
     Returns dict with: case_number, type, year
     """
-    stem = filepath.stem  # Filename without extension
+    # Copy so callers can add keys without touching the cached result
+    return dict(_parse_filename_cached(filepath.name))
+
+
+@lru_cache(maxsize=8192)
+def _parse_filename_cached(filename: str) -> dict:
+    """Parse a bare filename; memoized for batch runs over many PDFs."""
+    stem = Path(filename).stem  # Filename without extension
 
     # Split on first underscore to get case_number and type
     parts = stem.split("_", 1)
@@ -195,7 +272,7 @@ def parse_filename(filepath: Path) -> dict:
 
     # Extract year from case number (format: YY-XXXXX-N)
     year = None
-    year_match = re.match(r"^(\d{2})-", case_number)
+    year_match = YEAR_PREFIX_PATTERN.match(case_number)
     if year_match:
         year_prefix = int(year_match.group(1))
         # Convert 2-digit year to 4-digit (00-30 = 2000-2030, 31-99 = 1931-1999)
@@ -242,6 +319,13 @@ OCR_TIMEOUT_PER_PAGE = 30    # Additional seconds per page
 OCR_TIMEOUT_MIN = 120        # Minimum timeout (2 minutes)
 OCR_TIMEOUT_MAX = 1800       # Maximum timeout (30 minutes)
 
+# Pages OCR'd in parallel by ocrmypdf (one tesseract process per page)
+OCR_JOBS = int(os.environ.get("OCR_JOBS", os.cpu_count() or 2))
+
+# Minimum page counts for the slower preprocessing passes (unpaper --clean, --deskew)
+OCR_CLEAN_MIN_PAGES = 3
+OCR_DESKEW_MIN_PAGES = 2
+
 
 def check_ocr_dependencies() -> bool:
     """Check that required OCR tools are installed."""
@@ -292,11 +376,13 @@ def get_page_count(pdf_path: Path) -> int:
         raise ValueError("pdfinfo timed out")
 
 
-def calculate_ocr_timeout(page_count: int) -> int:
+def calculate_ocr_timeout(page_count: int, jobs: int = 1) -> int:
     """
     Calculate OCR timeout based on page count.
 
-    Formula: max(MIN, min(MAX, BASE + pages * PER_PAGE))
+    Pages are OCR'd `jobs` at a time, so only ceil(pages / jobs) of them add to
+    the wall time. Formula: max(MIN, min(MAX, BASE + ceil(pages / jobs) * PER_PAGE))
+    With jobs=1:
     - 1 page: 120s (minimum)
     - 5 pages: 210s (3.5 min)
     - 10 pages: 360s (6 min)
@@ -306,23 +392,52 @@ def calculate_ocr_timeout(page_count: int) -> int:
 
     Args:
         page_count: Number of pages in the PDF
+        jobs: Number of pages OCR'd in parallel
 
     Returns:
         Timeout in seconds
     """
-    calculated = OCR_TIMEOUT_BASE + (page_count * OCR_TIMEOUT_PER_PAGE)
+    sequential_pages = -(-page_count // max(1, jobs))
+    calculated = OCR_TIMEOUT_BASE + (sequential_pages * OCR_TIMEOUT_PER_PAGE)
     return max(OCR_TIMEOUT_MIN, min(OCR_TIMEOUT_MAX, calculated))
 
 
-def ocr_pdf(input_path: Path, output_pdf_path: Path, output_text_path: Path, timeout: int) -> dict:
+def count_words(path: Path, chunk_size: int = 65536) -> int:
+    """Count whitespace-separated words in a file without loading it into memory."""
+    count = 0
+    in_word = False
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            count += len(chunk.split())
+            # A word split across the chunk boundary was counted twice
+            if in_word and not chunk[:1].isspace():
+                count -= 1
+            in_word = not chunk[-1:].isspace()
+    return count
+
+
+def ocr_pdf(
+    input_path: Path,
+    output_pdf_path: Path,
+    output_text_path: Path,
+    timeout: int,
+    jobs: int = OCR_JOBS,
+    page_count: int | None = None,
+) -> dict:
     """
     OCR a single PDF and extract text.
 
+    ocrmypdf splits the document by page and runs up to `jobs` pages in parallel,
+    writing the sidecar text in page order. Short documents skip the slower
+    image preprocessing passes (see OCR_CLEAN_MIN_PAGES / OCR_DESKEW_MIN_PAGES).
+
     Args:
         input_path: Path to input PDF
         output_pdf_path: Path for searchable PDF output
         output_text_path: Path for extracted text output
         timeout: Timeout in seconds
+        jobs: Number of pages to OCR in parallel
+        page_count: Number of pages, if known (enables all preprocessing if None)
 
     Returns:
         dict with success, error, word_count, duration_seconds, timeout_used
@@ -334,15 +449,19 @@ def ocr_pdf(input_path: Path, output_pdf_path: Path, output_text_path: Path, tim
     output_text_path.parent.mkdir(parents=True, exist_ok=True)
 
     try:
+        preprocessing = ["--rotate-pages"]
+        if page_count is None or page_count >= OCR_DESKEW_MIN_PAGES:
+            preprocessing.append("--deskew")
+        if page_count is None or page_count >= OCR_CLEAN_MIN_PAGES:
+            preprocessing.append("--clean")
+
         cmd = [
             "ocrmypdf",
             "--sidecar", str(output_text_path),
-            "--rotate-pages",
-            "--deskew",
-            "--clean",
+            *preprocessing,
             "--force-ocr",
             "-l", "eng",
-            "--jobs", "2",
+            "--jobs", str(jobs),
             str(input_path),
             str(output_pdf_path),
         ]
@@ -373,8 +492,7 @@ def ocr_pdf(input_path: Path, output_pdf_path: Path, output_text_path: Path, tim
         # Get word count
         word_count = None
         if output_text_path.exists():
-            text_content = output_text_path.read_text(errors="ignore")
-            word_count = len(text_content.split())
+            word_count = count_words(output_text_path)
 
         return {
             "success": True,
@@ -413,30 +531,25 @@ def is_gibberish_line(line: str) -> bool:
     if len(words) < 2:
         return False
 
-    short_words = sum(1 for w in words if len(w) <= 3)
+    # Word lengths computed once and reused by the counts below
+    lengths = [len(w) for w in words]
+    short_words = sum(1 for n in lengths if n < 4)
     short_ratio = short_words / len(words)
 
     if short_ratio < 0.7:
         return False
 
-    avg_len = sum(len(w) for w in words) / len(words)
+    avg_len = sum(lengths) / len(words)
     if avg_len > 3.5:
         return False
 
     # Check for specific gibberish patterns
-    gibberish_indicators = [
-        "WwW", "wWw", "Ww", "wW", "Bw", "wB", "BW",
-        "ND", "YN", "NH", "NM", "FB", "FF", "FW",
-        "eB", "Be", "eH", "mw", "mn", "nn", "fF", "Ff",
-        "Se", "Oe", "oO", "HD", "SS", "DAH", "DAW", "UDF",
-    ]
-
-    indicator_count = sum(1 for ind in gibberish_indicators if ind in stripped)
+    indicator_count = sum(ind in stripped for ind in GIBBERISH_INDICATORS)
 
     if indicator_count >= 2 and short_ratio >= 0.6:
         return True
 
-    two_char_words = sum(1 for w in words if len(w) == 2)
+    two_char_words = lengths.count(2)
     if two_char_words >= 3 and len(words) >= 4 and avg_len <= 2.5:
         return True
 
@@ -445,9 +558,9 @@ def is_gibberish_line(line: str) -> bool:
 
 def should_remove_line(line: str) -> tuple[bool, str]:
     """Check if a line should be removed. Returns (should_remove, reason)."""
-    for name, pattern in CLEANING_PATTERNS.items():
-        if pattern.match(line):
-            return True, name
+    match = COMBINED_CLEANING_PATTERN.match(line)
+    if match:
+        return True, match.lastgroup
 
     if is_gibberish_line(line):
         return True, "gibberish"
@@ -468,56 +581,163 @@ def clean_text(text: str) -> str:
     return "\n".join(cleaned_lines)
 
 
-def clean_text_file(filepath: Path) -> dict:
-    """Clean a text file in place. Returns stats."""
-    with open(filepath, "r", encoding="utf-8", errors="replace") as f:
-        original_text = f.read()
-
-    original_lines = original_text.split("\n")
-    cleaned_text = clean_text(original_text)
-    cleaned_lines = cleaned_text.split("\n")
-
-    removed_count = len(original_lines) - len(cleaned_lines)
+def clean_text_file(filepath: Path) -> tuple[dict, str]:
+    """
+    Clean a text file in place, writing kept lines to a temp file that replaces it.
 
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(cleaned_text)
+    Returns (stats, cleaned text) so callers don't have to read the file back.
+    """
+    original_lines = 0
+    cleaned_lines = 0
+    cleaned = io.StringIO()
+    tmp_path = filepath.with_name(filepath.name + ".tmp")
 
-    return {
-        "original_lines": len(original_lines),
-        "cleaned_lines": len(cleaned_lines),
-        "removed_lines": removed_count,
+    try:
+        with open(filepath, "r", encoding="utf-8", errors="replace") as src, \
+                open(tmp_path, "w", encoding="utf-8") as dst:
+            for line in src:
+                original_lines += 1
+                should_remove, _ = should_remove_line(line.rstrip("\n"))
+                if not should_remove:
+                    cleaned_lines += 1
+                    dst.write(line)
+                    cleaned.write(line)
+
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    stats = {
+        "original_lines": original_lines,
+        "cleaned_lines": cleaned_lines,
+        "removed_lines": original_lines - cleaned_lines,
     }
+    return stats, cleaned.getvalue()
 
 
 # -----------------------------------------------------------------------------
 # LLM Processing
 # -----------------------------------------------------------------------------
 
+# OpenAI budgets shared by every thread in the process (0 = unlimited)
+OPENAI_RPM = int(os.environ.get("OPENAI_RPM", "0"))
+OPENAI_TPM = int(os.environ.get("OPENAI_TPM", "0"))
+
+# Retries (exponential backoff, honoring Retry-After) on 429s and transient errors
+OPENAI_MAX_RETRIES = 5
+
+# Token estimate used for rate limiting (no tokenizer dependency)
+CHARS_PER_TOKEN = 4
+ESTIMATED_OUTPUT_TOKENS = 1000
+
+
+class RateLimiter:
+    """
+    Thread-safe OpenAI throttle pacing requests-per-minute and tokens-per-minute.
+
+    Budgets refill continuously at limit/60 per second; acquire() blocks until both
+    can cover the request, so concurrent workers slow down instead of hitting 429s.
+    A limit of 0 disables that budget.
+    """
+
+    def __init__(self, rpm: int, tpm: int):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.available_requests = float(rpm)
+        self.available_tokens = float(tpm)
+        self.last_update = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, tokens: int) -> None:
+        if not self.rpm and not self.tpm:
+            return
+        tokens = min(tokens, self.tpm)  # Oversized requests wait for a full bucket
+        with self.lock:
+            while True:
+                now = time.monotonic()
+                elapsed = now - self.last_update
+                self.last_update = now
+                self.available_requests = min(self.rpm, self.available_requests + self.rpm / 60 * elapsed)
+                self.available_tokens = min(self.tpm, self.available_tokens + self.tpm / 60 * elapsed)
+
+                request_short = 1 - self.available_requests if self.rpm else 0
+                token_short = tokens - self.available_tokens if self.tpm else 0
+                if request_short <= 0 and token_short <= 0:
+                    self.available_requests -= 1
+                    self.available_tokens -= tokens
+                    return
+                time.sleep(max(
+                    request_short * 60 / self.rpm if self.rpm else 0,
+                    token_short * 60 / self.tpm if self.tpm else 0,
+                ))
+
+
+OPENAI_RATE_LIMITER = RateLimiter(OPENAI_RPM, OPENAI_TPM)
+
+
+def estimate_tokens(system_prompt: str, user_content: str) -> int:
+    """Rough token cost of a request (prompt + expected completion)."""
+    return (len(system_prompt) + len(user_content)) // CHARS_PER_TOKEN + ESTIMATED_OUTPUT_TOKENS
+
+
+@lru_cache(maxsize=1)
 def get_mongo_client() -> MongoClient:
-    """Create MongoDB client from environment variable."""
+    """MongoDB client from environment variable (created once per process, so its connection pool is reused)."""
     mongo_uri = os.environ.get("MONGODB_URI")
     if not mongo_uri:
         raise ValueError("MONGODB_URI environment variable is required")
     return MongoClient(mongo_uri)
 
 
+@lru_cache(maxsize=1)
 def get_openai_client() -> OpenAI:
-    """Create OpenAI client from environment variable."""
+    """OpenAI client from environment variable (created once per process, so its HTTP connections are reused)."""
     api_key = os.environ.get("OPENAI_API_KEY")
     if not api_key:
         raise ValueError("OPENAI_API_KEY environment variable is required")
-    return OpenAI(api_key=api_key)
+    return OpenAI(api_key=api_key, max_retries=OPENAI_MAX_RETRIES)
 
 
+@lru_cache(maxsize=None)
 def load_prompt(prompt_name: str) -> str:
-    """Load a prompt file from the prompts directory."""
-    prompt_path = PROMPTS_DIR / f"{prompt_name}.md"
-    with open(prompt_path, "r") as f:
-        return f.read()
+    """Load a prompt file from the prompts directory (read once per process)."""
+    return (PROMPTS_DIR / f"{prompt_name}.md").read_text()
+
 
+def llm_cache_key(model: str, system_prompt: str, user_content: str) -> str:
+    """Content-addressed key for an LLM request (sha256 of model, prompt, and content)."""
+    digest = hashlib.sha256()
+    for part in (model, system_prompt, user_content):
+        encoded = part.encode()
+        # Length-prefix each part so field boundaries can't collide
+        digest.update(f"{len(encoded)}:".encode())
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
+def call_openai(
+    client: OpenAI,
+    system_prompt: str,
+    user_content: str,
+    model: str = "gpt-4o",
+    cache: Collection | None = None,
+) -> dict:
+    """
+    Call OpenAI API and parse JSON response.
 
-def call_openai(client: OpenAI, system_prompt: str, user_content: str, model: str = "gpt-4o") -> dict:
-    """Call OpenAI API and parse JSON response."""
+    If `cache` (the llm_cache collection) is given, identical requests are served
+    from it and new responses are stored there. Uncached requests are paced by
+    OPENAI_RATE_LIMITER.
+    """
+    cache_key = None
+    if cache is not None:
+        cache_key = llm_cache_key(model, system_prompt, user_content)
+        hit = cache.find_one({"_id": cache_key}, {"response": 1})
+        if hit:
+            return hit["response"]
+
+    OPENAI_RATE_LIMITER.acquire(estimate_tokens(system_prompt, user_content))
     response = client.chat.completions.create(
         model=model,
         messages=[
@@ -529,7 +749,121 @@ def call_openai(client: OpenAI, system_prompt: str, user_content: str, model: st
     )
 
     content = response.choices[0].message.content
-    return json.loads(content)
+    result = json.loads(content)
+
+    if cache is not None:
+        store_cached_response(cache, cache_key, model, result)
+
+    return result
+
+
+def store_cached_response(cache: Collection, cache_key: str, model: str, result: dict) -> None:
+    """Save an LLM response in the llm_cache collection."""
+    try:
+        cache.insert_one({
+            "_id": cache_key,
+            "model": model,
+            "response": result,
+            "created_at": datetime.now(timezone.utc),
+        })
+    except DuplicateKeyError:
+        pass  # Stored concurrently by another worker
+
+
+def call_openai_batch(
+    client: OpenAI,
+    system_prompt: str,
+    user_contents: list[str],
+    model: str = "gpt-4o",
+    cache: Collection | None = None,
+) -> list[dict]:
+    """
+    Extract several short documents with as few OpenAI requests as possible.
+
+    Documents are packed into requests of up to BATCH_PROMPT_MAX_DOCS documents /
+    BATCH_PROMPT_MAX_CHARS characters and the model returns one result per input
+    id. Shared-prompt results are cached per document under a key for the batch
+    prompt, never the single-document key, so call_openai is not served output
+    from a different prompt. A document already cached either way is not resent.
+    Documents the model skips fall back to their own request.
+
+    Returns:
+        One result per entry in user_contents, in order
+    """
+    batch_prompt = system_prompt + BATCH_PROMPT_INSTRUCTIONS
+    results: list[dict | None] = [None] * len(user_contents)
+    batch_cache_keys: list[str | None] = [None] * len(user_contents)
+
+    pending = []
+    for i, user_content in enumerate(user_contents):
+        if cache is not None:
+            batch_cache_keys[i] = llm_cache_key(model, batch_prompt, user_content)
+            single_cache_key = llm_cache_key(model, system_prompt, user_content)
+            hit = cache.find_one({"_id": {"$in": [single_cache_key, batch_cache_keys[i]]}}, {"response": 1})
+            if hit:
+                results[i] = hit["response"]
+                continue
+        pending.append(i)
+
+    # Pack uncached documents into requests
+    groups: list[list[int]] = []
+    group_chars = 0
+    for i in pending:
+        size = len(user_contents[i])
+        if not groups or len(groups[-1]) >= BATCH_PROMPT_MAX_DOCS or group_chars + size > BATCH_PROMPT_MAX_CHARS:
+            groups.append([])
+            group_chars = 0
+        groups[-1].append(i)
+        group_chars += size
+
+    for group in groups:
+        if len(group) == 1:
+            continue  # Sent on its own below
+
+        payload = json.dumps([{"id": i, "content": user_contents[i]} for i in group])
+        OPENAI_RATE_LIMITER.acquire(
+            estimate_tokens(batch_prompt, payload) + ESTIMATED_OUTPUT_TOKENS * (len(group) - 1)
+        )
+        response = client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": batch_prompt},
+                {"role": "user", "content": payload}
+            ],
+            temperature=0.1,
+            response_format={"type": "json_object"}
+        )
+
+        batch_result = json.loads(response.choices[0].message.content)
+        for item in batch_result.get("results", []):
+            i = item.get("id") if isinstance(item, dict) else None
+            if i in group and results[i] is None and isinstance(item.get("extraction"), dict):
+                results[i] = item["extraction"]
+                if cache is not None:
+                    store_cached_response(cache, batch_cache_keys[i], model, results[i])
+
+    # Singletons and anything the model left out
+    for i in pending:
+        if results[i] is None:
+            results[i] = call_openai(client, system_prompt, user_contents[i], model, cache)
+
+    return results
+
+
+def build_user_content(metadata: dict, body: str, note: str = "") -> str:
+    """Build the LLM user message: a metadata header (plus optional note) and the document text."""
+    return f"""## Metadata
+
+- **Title:** {metadata.get('title', metadata['type'])}
+- **Respondent:** {metadata.get('respondent', 'Unknown')}
+- **Case Number:** {metadata['case_number']}
+- **Date:** {metadata.get('date', 'Unknown')}
+- **Type:** {metadata['type']}{note}
+
+## Document Text
+
+{body}
+"""
 
 
 def chunk_text(text: str, max_chars: int = 70000, overlap: int = 500) -> list[str]:
@@ -579,42 +913,32 @@ def merge_extraction_results(results: list[dict]) -> dict:
         "_chunk_count": len(results),
     }
 
+    # Keys already merged into each array, so dedup is a set lookup per item
+    seen_restrictions: set[str] = set()
+    seen_requirements: set[str] = set()
+    seen_nrs_codes: set = set()
+
     for r in results:
-        if not merged["license_action"] and r.get("license_action"):
-            merged["license_action"] = r["license_action"]
-        if not merged["probation_months"] and r.get("probation_months"):
-            merged["probation_months"] = r["probation_months"]
-        if not merged["ineligible_to_reapply_months"] and r.get("ineligible_to_reapply_months"):
-            merged["ineligible_to_reapply_months"] = r["ineligible_to_reapply_months"]
-        if not merged["fine_amount"] and r.get("fine_amount"):
-            merged["fine_amount"] = r["fine_amount"]
-        if not merged["investigation_costs"] and r.get("investigation_costs"):
-            merged["investigation_costs"] = r["investigation_costs"]
-        if not merged["charity_donation"] and r.get("charity_donation"):
-            merged["charity_donation"] = r["charity_donation"]
-        if not merged["costs_payment_deadline_days"] and r.get("costs_payment_deadline_days"):
-            merged["costs_payment_deadline_days"] = r["costs_payment_deadline_days"]
-        if r.get("costs_stayed"):
-            merged["costs_stayed"] = True
-        if not merged["cme_hours"] and r.get("cme_hours"):
-            merged["cme_hours"] = r["cme_hours"]
-        if not merged["cme_topic"] and r.get("cme_topic"):
-            merged["cme_topic"] = r["cme_topic"]
-        if not merged["cme_deadline_months"] and r.get("cme_deadline_months"):
-            merged["cme_deadline_months"] = r["cme_deadline_months"]
-        if r.get("public_reprimand"):
-            merged["public_reprimand"] = True
-        if r.get("npdb_report"):
-            merged["npdb_report"] = True
+        for field in MERGE_FIRST_VALUE_FIELDS:
+            if not merged[field] and r.get(field):
+                merged[field] = r[field]
+        for field in MERGE_ANY_TRUE_FIELDS:
+            if r.get(field):
+                merged[field] = True
 
         for restriction in r.get("practice_restrictions", []):
-            if restriction not in merged["practice_restrictions"]:
+            key = json.dumps(restriction, sort_keys=True)
+            if key not in seen_restrictions:
+                seen_restrictions.add(key)
                 merged["practice_restrictions"].append(restriction)
         for req in r.get("monitoring_requirements", []):
-            if req not in merged["monitoring_requirements"]:
+            key = json.dumps(req, sort_keys=True)
+            if key not in seen_requirements:
+                seen_requirements.add(key)
                 merged["monitoring_requirements"].append(req)
         for v in r.get("violations_admitted", []):
-            if not any(existing.get("nrs_code") == v.get("nrs_code") for existing in merged["violations_admitted"]):
+            if v.get("nrs_code") not in seen_nrs_codes:
+                seen_nrs_codes.add(v.get("nrs_code"))
                 merged["violations_admitted"].append(v)
 
     return merged
@@ -646,26 +970,17 @@ def process_complaint(
 
     complaints_collection = db["complaints"]
 
-    # Check for existing complaint
-    existing_complaint = complaints_collection.find_one({"case_number": case_number})
+    # Check for existing complaint (only amended complaints use it, and only these fields)
+    existing_complaint = None
+    if is_amended:
+        existing_complaint = complaints_collection.find_one(
+            {"case_number": case_number},
+            {"type": 1, "date": 1, "pdf_url": 1, "text_file": 1, "text_content": 1},
+        )
 
     # Load prompts
     extraction_prompt = load_prompt("complaint_extraction")
 
-    # Build user content for LLM
-    user_content = f"""## Metadata
-
-- **Title:** {metadata.get('title', doc_type)}
-- **Respondent:** {metadata.get('respondent', 'Unknown')}
-- **Case Number:** {case_number}
-- **Date:** {metadata.get('date', 'Unknown')}
-- **Type:** {doc_type}
-
-## Document Text
-
-{text_content}
-"""
-
     # Check for OCR failure
     line_count = len([l for l in text_content.strip().split('\n') if l.strip()])
     ocr_failed = line_count <= 1
@@ -701,7 +1016,8 @@ def process_complaint(
     # Process with LLM if OCR succeeded
     if not ocr_failed:
         print("  Calling OpenAI for complaint extraction...")
-        llm_result = call_openai(openai_client, extraction_prompt, user_content, model)
+        user_content = build_user_content(metadata, text_content)
+        llm_result = call_openai(openai_client, extraction_prompt, user_content, model, db["llm_cache"])
         document["llm_extracted"] = llm_result
         document["llm_model"] = model
         result["llm_extracted"] = llm_result
@@ -734,7 +1050,9 @@ def process_complaint(
 {text_content[:max_chars]}
 """
             try:
-                comparison_result = call_openai(openai_client, comparison_prompt, comparison_content, model)
+                comparison_result = call_openai(
+                    openai_client, comparison_prompt, comparison_content, model, db["llm_cache"]
+                )
                 amendment_summary = comparison_result.get("amendment_summary")
                 if amendment_summary:
                     document["amendment_summary"] = amendment_summary
@@ -764,12 +1082,18 @@ def process_settlement(
     openai_client: OpenAI,
     db,
     dry_run: bool = False,
-    model: str = "gpt-4o"
+    model: str = "gpt-4o",
+    defer_write: bool = False,
+    prefetched_extraction: dict | None = None,
 ) -> dict:
     """
     Process a settlement document through LLM and store in MongoDB.
 
-    Links settlement to associated complaint(s) via case_numbers.
+    Links settlement to associated complaint(s) via case_numbers. With
+    `defer_write`, the upsert is returned as result["write"] for a batched
+    bulk_write instead of being executed. A `prefetched_extraction` (from
+    prefetch_settlement_extractions) is used instead of calling OpenAI for a
+    single-chunk document.
     """
     case_number = metadata["case_number"]
     case_numbers = metadata.get("case_numbers", [case_number])
@@ -797,12 +1121,12 @@ def process_settlement(
         result["dry_run"] = True
         return result
 
-    # Look up linked complaints
-    complaint_ids = []
-    for cn in case_numbers:
-        complaint = complaints_collection.find_one({"case_number": cn}, {"_id": 1})
-        if complaint:
-            complaint_ids.append(complaint["_id"])
+    # Look up linked complaints in one query, keeping case_numbers order
+    complaint_id_by_case = {
+        doc["case_number"]: doc["_id"]
+        for doc in complaints_collection.find({"case_number": {"$in": case_numbers}}, {"_id": 1, "case_number": 1})
+    }
+    complaint_ids = [complaint_id_by_case[cn] for cn in case_numbers if cn in complaint_id_by_case]
 
     result["linked_complaints"] = len(complaint_ids)
     if complaint_ids:
@@ -837,24 +1161,17 @@ def process_settlement(
         if len(chunks) > 1:
             print(f"  Document split into {len(chunks)} chunks")
 
-        chunk_results = []
-        for i, chunk in enumerate(chunks):
+        def extract_chunk(i: int, chunk: str) -> dict:
             chunk_note = f"\n\n[This is part {i+1} of {len(chunks)} of the document]" if len(chunks) > 1 else ""
+            user_content = build_user_content(metadata, chunk, chunk_note)
+            return call_openai(openai_client, extraction_prompt, user_content, model, db["llm_cache"])
 
-            user_content = f"""## Metadata
-
-- **Title:** {metadata.get('title', doc_type)}
-- **Respondent:** {metadata.get('respondent', 'Unknown')}
-- **Case Number:** {case_number}
-- **Date:** {metadata.get('date', 'Unknown')}
-- **Type:** {doc_type}{chunk_note}
-
-## Document Text
-
-{chunk}
-"""
-            chunk_result = call_openai(openai_client, extraction_prompt, user_content, model)
-            chunk_results.append(chunk_result)
+        if prefetched_extraction is not None and len(chunks) == 1:
+            chunk_results = [prefetched_extraction]
+        else:
+            # Chunks are independent, so extract them concurrently (merged in order below)
+            with ThreadPoolExecutor(max_workers=min(len(chunks), MAX_CHUNK_CONCURRENCY)) as executor:
+                chunk_results = list(executor.map(extract_chunk, range(len(chunks)), chunks))
 
         llm_result = merge_extraction_results(chunk_results)
         document["llm_extracted"] = llm_result
@@ -863,16 +1180,48 @@ def process_settlement(
         print(f"  Extracted: {llm_result.get('license_action', 'Unknown')} - Fine: ${llm_result.get('fine_amount', 0) or 0:,.0f}")
 
     # Upsert to MongoDB by pdf_url
-    settlements_collection.update_one(
-        {"pdf_url": pdf_url},
-        {"$set": document},
-        upsert=True
-    )
-    print("  Stored in MongoDB (settlements collection)")
+    if defer_write:
+        result["write"] = ("settlements", UpdateOne({"pdf_url": pdf_url}, {"$set": document}, upsert=True))
+        print("  Queued for MongoDB (settlements collection)")
+    else:
+        settlements_collection.update_one(
+            {"pdf_url": pdf_url},
+            {"$set": document},
+            upsert=True
+        )
+        print("  Stored in MongoDB (settlements collection)")
 
     return result
 
 
+def is_batchable_settlement(prepared: dict) -> bool:
+    """Whether a prepared file is a short settlement worth extracting in a shared prompt."""
+    if prepared["classification"] != "settlement":
+        return False
+    if len(prepared["text_content"]) > BATCH_PROMPT_DOC_MAX_CHARS:
+        return False
+    # OCR failures are stored without an LLM call
+    return prepared["line_count"] > 1
+
+
+def prefetch_settlement_extractions(
+    prepared_files: list[dict], db, openai_client: OpenAI, model: str = "gpt-4o"
+) -> list[dict]:
+    """
+    Extract short settlements together in shared prompts.
+
+    Builds the same user message process_settlement sends for a single-chunk
+    document. The results are handed to process_settlement as its
+    prefetched_extraction (via prepared["prefetched_extraction"]).
+
+    Returns:
+        One extraction per entry in prepared_files, in order
+    """
+    print(f"  Calling OpenAI for {len(prepared_files)} short settlements in shared prompts...")
+    user_contents = [build_user_content(p["metadata"], p["text_content"]) for p in prepared_files]
+    return call_openai_batch(openai_client, load_prompt("settlement_extraction"), user_contents, model, db["llm_cache"])
+
+
 # -----------------------------------------------------------------------------
 # License-Only Filing Processing
 # -----------------------------------------------------------------------------
@@ -882,6 +1231,7 @@ def process_license_only_filing(
     text_content: str,
     db,
     dry_run: bool = False,
+    defer_write: bool = False,
 ) -> dict:
     """
     Process a license-only filing document and store in MongoDB.
@@ -890,7 +1240,8 @@ def process_license_only_filing(
     (e.g., LICENSE-401) rather than a formal complaint case. These include
     summary suspensions, voluntary surrenders, probation releases, etc.
 
-    No LLM processing is performed - just stores metadata and OCR text.
+    No LLM processing is performed - just stores metadata and OCR text. With
+    `defer_write`, the upsert is returned as result["write"] instead of executed.
     """
     license_number = metadata["case_number"]  # e.g., "LICENSE-401"
     doc_type = metadata["type"]
@@ -928,12 +1279,16 @@ def process_license_only_filing(
     }
 
     # Upsert to MongoDB by pdf_url (unique identifier)
-    collection.update_one(
-        {"pdf_url": pdf_url},
-        {"$set": document},
-        upsert=True
-    )
-    print("  Stored in MongoDB (license_only_filings collection)")
+    if defer_write:
+        result["write"] = ("license_only_filings", UpdateOne({"pdf_url": pdf_url}, {"$set": document}, upsert=True))
+        print("  Queued for MongoDB (license_only_filings collection)")
+    else:
+        collection.update_one(
+            {"pdf_url": pdf_url},
+            {"$set": document},
+            upsert=True
+        )
+        print("  Stored in MongoDB (license_only_filings collection)")
 
     return result
 
@@ -942,28 +1297,27 @@ def process_license_only_filing(
 # Main Pipeline
 # -----------------------------------------------------------------------------
 
-def process_single_file(
+def prepare_file(
     pdf_path: Path,
     output_dir: Path | None = None,
-    dry_run: bool = False,
     skip_ocr: bool = False,
-    model: str = "gpt-4o",
     filing_metadata: dict | None = None,
+    ocr_jobs: int = OCR_JOBS,
 ) -> dict:
     """
-    Process a single PDF file through the entire pipeline.
+    Run the local (CPU-bound) stages for a PDF: classify, OCR, and clean.
 
     Args:
         pdf_path: Path to the PDF file
-        output_dir: Directory for OCR outputs (default: creates temp dir or uses standard structure)
-        dry_run: If True, don't store in MongoDB
+        output_dir: Directory for OCR outputs (default: uses standard structure)
         skip_ocr: If True, assume text file already exists
-        model: OpenAI model to use
         filing_metadata: Optional metadata from scraper (date, respondent, pdf_url, etc.)
-                        Supplements/overrides filename-parsed metadata.
+        ocr_jobs: Number of pages OCR'd in parallel
 
     Returns:
-        dict with processing results
+        dict with status "ready" plus metadata, classification, text_content and
+        line_count (non-blank lines), or a final result dict with status
+        "ignored" or "error"
     """
     print(f"\n{'='*60}")
     print(f"Processing: {pdf_path.name}")
@@ -1022,13 +1376,15 @@ def process_single_file(
         # Get page count and calculate timeout
         try:
             page_count = get_page_count(pdf_path)
-            ocr_timeout = calculate_ocr_timeout(page_count)
+            ocr_timeout = calculate_ocr_timeout(page_count, ocr_jobs)
             print(f"  Pages: {page_count}, Timeout: {ocr_timeout}s ({ocr_timeout // 60}m {ocr_timeout % 60}s)")
         except ValueError as e:
             print(f"  Error reading PDF: {e}")
             return {"status": "error", "error": f"Invalid PDF: {e}"}
 
-        ocr_result = ocr_pdf(pdf_path, ocr_pdf_path, text_path, timeout=ocr_timeout)
+        ocr_result = ocr_pdf(
+            pdf_path, ocr_pdf_path, text_path, timeout=ocr_timeout, jobs=ocr_jobs, page_count=page_count
+        )
 
         if not ocr_result["success"]:
             print(f"  OCR failed: {ocr_result['error']}")
@@ -1038,11 +1394,46 @@ def process_single_file(
 
     # Step 2: Clean text
     print(f"\n  Step 2: Text Cleaning")
-    clean_stats = clean_text_file(text_path)
+    clean_stats, text_content = clean_text_file(text_path)
     print(f"  Removed {clean_stats['removed_lines']} artifact lines ({clean_stats['original_lines']} -> {clean_stats['cleaned_lines']})")
 
-    # Read cleaned text
-    text_content = text_path.read_text(encoding="utf-8", errors="replace")
+    return {
+        "status": "ready",
+        "metadata": metadata,
+        "classification": doc_class,
+        "text_content": text_content,
+        # Non-blank lines; one or none means OCR failed
+        "line_count": len([l for l in text_content.strip().split('\n') if l.strip()]),
+    }
+
+
+def store_file(
+    prepared: dict,
+    db=None,
+    openai_client: OpenAI | None = None,
+    dry_run: bool = False,
+    model: str = "gpt-4o",
+    defer_write: bool = False,
+) -> dict:
+    """
+    Run the network-bound stages for a prepared file: LLM extraction and MongoDB storage.
+
+    Args:
+        prepared: A "ready" result from prepare_file
+        db: MongoDB database (connected on demand if None)
+        openai_client: OpenAI client (created on demand if None)
+        dry_run: If True, don't call the LLM or store in MongoDB
+        model: OpenAI model to use
+        defer_write: If True, settlement/license-only upserts are returned as
+                     result["write"] instead of executed (complaints are always
+                     written immediately so later files can link to them)
+
+    Returns:
+        dict with processing results
+    """
+    metadata = prepared["metadata"]
+    doc_class = prepared["classification"]
+    text_content = prepared["text_content"]
 
     # Step 3: Store in MongoDB (with LLM processing for complaints/settlements)
     if doc_class == "license_only":
@@ -1062,18 +1453,21 @@ def process_single_file(
         }
 
     # Connect to services
-    mongo_client = get_mongo_client()
-    db = mongo_client["malpractice"]
+    if db is None:
+        db = get_mongo_client()["malpractice"]
+    if openai_client is None and doc_class != "license_only":
+        openai_client = get_openai_client()
 
     # Process based on document type
     if doc_class == "license_only":
-        result = process_license_only_filing(metadata, text_content, db, dry_run)
+        result = process_license_only_filing(metadata, text_content, db, dry_run, defer_write)
     elif doc_class == "complaint":
-        openai_client = get_openai_client()
         result = process_complaint(metadata, text_content, openai_client, db, dry_run, model)
     else:  # settlement
-        openai_client = get_openai_client()
-        result = process_settlement(metadata, text_content, openai_client, db, dry_run, model)
+        result = process_settlement(
+            metadata, text_content, openai_client, db, dry_run, model, defer_write,
+            prepared.get("prefetched_extraction"),
+        )
 
     result["status"] = "success"
     result["classification"] = doc_class
@@ -1082,6 +1476,221 @@ def process_single_file(
     return result
 
 
+def process_single_file(
+    pdf_path: Path,
+    output_dir: Path | None = None,
+    dry_run: bool = False,
+    skip_ocr: bool = False,
+    model: str = "gpt-4o",
+    filing_metadata: dict | None = None,
+    db=None,
+    openai_client: OpenAI | None = None,
+    defer_write: bool = False,
+    ocr_jobs: int = OCR_JOBS,
+) -> dict:
+    """
+    Process a single PDF file through the entire pipeline.
+
+    Args:
+        pdf_path: Path to the PDF file
+        output_dir: Directory for OCR outputs (default: creates temp dir or uses standard structure)
+        dry_run: If True, don't store in MongoDB
+        skip_ocr: If True, assume text file already exists
+        model: OpenAI model to use
+        filing_metadata: Optional metadata from scraper (date, respondent, pdf_url, etc.)
+                        Supplements/overrides filename-parsed metadata.
+        db: MongoDB database to reuse across calls (connected on demand if None)
+        openai_client: OpenAI client to reuse across calls (created on demand if None)
+        defer_write: If True, settlement/license-only upserts are returned as
+                     result["write"] for write_deferred() instead of executed
+        ocr_jobs: Number of pages OCR'd in parallel (split OCR_JOBS between
+                  concurrent callers so the OCR timeout stays realistic)
+
+    Returns:
+        dict with processing results
+    """
+    prepared = prepare_file(pdf_path, output_dir, skip_ocr, filing_metadata, ocr_jobs)
+    if prepared["status"] != "ready":
+        return prepared
+    return store_file(prepared, db, openai_client, dry_run, model, defer_write)
+
+
+def write_deferred(db, pending_writes: dict[str, list[tuple[str, UpdateOne]]]) -> dict[str, str]:
+    """
+    Flush deferred upserts with unordered bulk_writes.
+
+    Args:
+        db: MongoDB database
+        pending_writes: Collection name -> (key, operation) pairs, where key
+                        identifies the file the upsert came from. Cleared on return.
+
+    Returns:
+        {key: error message} for every upsert that was not written. A failed
+        operation (or batch) doesn't stop the rest.
+    """
+    failed = {}
+    for collection_name, writes in pending_writes.items():
+        for i in range(0, len(writes), BULK_WRITE_BATCH_SIZE):
+            batch = writes[i:i + BULK_WRITE_BATCH_SIZE]
+            try:
+                db[collection_name].bulk_write([op for _, op in batch], ordered=False)
+                print(f"  Stored {len(batch)} documents in MongoDB ({collection_name} collection)")
+            except BulkWriteError as e:
+                write_errors = e.details.get("writeErrors", [])
+                for error in write_errors:
+                    failed[batch[error["index"]][0]] = error.get("errmsg", "Bulk write failed")
+                print(f"  Bulk write failed for {len(write_errors)} of {len(batch)} documents ({collection_name} collection)")
+            except PyMongoError as e:
+                for key, _ in batch:
+                    failed[key] = str(e)
+                print(f"  Bulk write failed for {len(batch)} documents ({collection_name} collection): {e}")
+    pending_writes.clear()
+    return failed
+
+
+def process_files(
+    pdf_paths: list[Path],
+    output_dir: Path | None = None,
+    dry_run: bool = False,
+    skip_ocr: bool = False,
+    model: str = "gpt-4o",
+    ocr_workers: int = 2,
+    llm_workers: int = 4,
+) -> list[dict]:
+    """
+    Process many PDF files, overlapping OCR of some files with LLM/MongoDB work on others.
+
+    OCR and cleaning run in a process pool; each prepared file is handed to a
+    thread pool for LLM extraction and storage as soon as it is ready, and
+    deferred writes are flushed as results arrive. Short settlements are first
+    grouped and extracted in shared prompts (see prefetch_settlement_extractions).
+    New files are only OCR'd while the LLM stage has fewer than
+    llm_workers + PIPELINE_BACKLOG files queued. A failure in one file is recorded
+    in its result and doesn't stop the batch.
+
+    Args:
+        pdf_paths: PDF files to process
+        output_dir: Directory for OCR outputs (default: uses standard structure)
+        dry_run: If True, don't store in MongoDB
+        skip_ocr: If True, assume text files already exist
+        model: OpenAI model to use
+        ocr_workers: Number of files OCR'd concurrently (OCR_JOBS page workers are split between them)
+        llm_workers: Number of files in the LLM/MongoDB stage concurrently
+
+    Returns:
+        One result dict per file (in completion order), each with a pdf_path key.
+        Files whose deferred upsert failed are reported with status "error".
+    """
+    db = None
+    openai_client = None
+    if not dry_run:
+        db = get_mongo_client()["malpractice"]
+        openai_client = get_openai_client()
+
+    # Deferred settlement/license-only upserts keyed by pdf_path, flushed with bulk_write
+    pending_writes: dict[str, list[tuple[str, UpdateOne]]] = defaultdict(list)
+
+    results = []
+    results_by_path: dict[str, dict] = {}
+
+    def flush_writes():
+        # A file only counts as stored once its deferred upsert is written
+        for key, error in write_deferred(db, pending_writes).items():
+            results_by_path[key].update(status="error", error=f"MongoDB write failed: {error}")
+
+    # Split the OCR cores between the files being OCR'd at once
+    ocr_jobs = max(1, OCR_JOBS // ocr_workers)
+
+    remaining = deque(pdf_paths)
+    in_flight: dict = {}  # future -> (stage, pdf_path), or ("prefetch", [(pdf_path, prepared)])
+    prefetch_buffer: list[tuple[Path, dict]] = []  # Short settlements awaiting a shared prompt
+
+    with ProcessPoolExecutor(max_workers=ocr_workers) as ocr_pool, \
+            ThreadPoolExecutor(max_workers=llm_workers) as llm_pool:
+
+        def submit_store(pdf_path: Path, prepared: dict):
+            future = llm_pool.submit(store_file, prepared, db, openai_client, dry_run, model, True)
+            in_flight[future] = ("store", pdf_path)
+
+        def flush_prefetch():
+            if not prefetch_buffer:
+                return
+            batch = prefetch_buffer.copy()
+            prefetch_buffer.clear()
+            future = llm_pool.submit(
+                prefetch_settlement_extractions, [prepared for _, prepared in batch], db, openai_client, model
+            )
+            in_flight[future] = ("prefetch", batch)
+
+        def fill_ocr_stage():
+            # Keep the OCR pool busy, but stop reading ahead once the LLM stage is
+            # backed up so prepared texts don't pile up in memory
+            ocr_running = 0
+            store_backlog = len(prefetch_buffer)
+            for stage, item in in_flight.values():
+                if stage == "prepare":
+                    ocr_running += 1
+                else:
+                    store_backlog += len(item) if stage == "prefetch" else 1
+            while remaining and ocr_running < ocr_workers and store_backlog < llm_workers + PIPELINE_BACKLOG:
+                pdf_path = remaining.popleft()
+                future = ocr_pool.submit(prepare_file, pdf_path, output_dir, skip_ocr, None, ocr_jobs)
+                in_flight[future] = ("prepare", pdf_path)
+                ocr_running += 1
+
+        fill_ocr_stage()
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage, pdf_path = in_flight.pop(future)
+
+                if stage == "prefetch":
+                    # Without a prefetched extraction, store_file sends the settlement on its own
+                    batch = pdf_path
+                    try:
+                        extractions = future.result()
+                    except Exception as e:
+                        print(f"  Shared-prompt extraction failed for {len(batch)} settlements, "
+                              f"falling back to individual requests: {e}")
+                        extractions = [None] * len(batch)
+                    for (batch_path, prepared), extraction in zip(batch, extractions):
+                        prepared["prefetched_extraction"] = extraction
+                        submit_store(batch_path, prepared)
+                    continue
+
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = {"status": "error", "error": str(e)}
+
+                if stage == "prepare" and result["status"] == "ready":
+                    if not dry_run and is_batchable_settlement(result):
+                        prefetch_buffer.append((pdf_path, result))
+                        if (len(prefetch_buffer) >= BATCH_PROMPT_MAX_DOCS
+                                or sum(len(p["text_content"]) for _, p in prefetch_buffer) >= BATCH_PROMPT_MAX_CHARS):
+                            flush_prefetch()
+                    else:
+                        submit_store(pdf_path, result)
+                    continue
+
+                result = {**result, "pdf_path": str(pdf_path)}
+                results.append(result)
+                results_by_path[result["pdf_path"]] = result
+                if "write" in result:
+                    collection_name, op = result.pop("write")
+                    pending_writes[collection_name].append((result["pdf_path"], op))
+                    if sum(map(len, pending_writes.values())) >= BULK_WRITE_BATCH_SIZE:
+                        flush_writes()
+
+            fill_ocr_stage()
+            # Don't hold a partial batch once no more files are being OCR'd
+            if not any(stage == "prepare" for stage, _ in in_flight.values()):
+                flush_prefetch()
+
+    flush_writes()
+    return results
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Process a single PDF file through the entire pipeline",
@@ -1092,16 +1701,51 @@ Examples:
     uv run python scripts/process_single_file.py my_file.pdf --dry-run
     uv run python scripts/process_single_file.py my_file.pdf --skip-ocr
     uv run python scripts/process_single_file.py my_file.pdf --output-dir ./output
+    uv run python scripts/process_single_file.py --batch pdfs/2024
         """
     )
-    parser.add_argument("pdf_path", type=Path, help="Path to the PDF file to process")
+    parser.add_argument("pdf_path", type=Path, nargs="?", help="Path to the PDF file to process")
+    parser.add_argument("--batch", type=Path, metavar="DIR", help="Process every PDF in a directory")
     parser.add_argument("--dry-run", action="store_true", help="Preview without storing in MongoDB")
     parser.add_argument("--skip-ocr", action="store_true", help="Skip OCR (text file must already exist)")
     parser.add_argument("--output-dir", type=Path, help="Custom output directory for OCR files")
     parser.add_argument("--model", type=str, default="gpt-4o", help="OpenAI model to use (default: gpt-4o)")
+    parser.add_argument("--ocr-workers", type=int, default=2, help="With --batch: files OCR'd concurrently (default: 2)")
+    parser.add_argument("--llm-workers", type=int, default=4, help="With --batch: files in LLM/MongoDB stage concurrently (default: 4)")
 
     args = parser.parse_args()
 
+    if args.batch:
+        if not args.batch.is_dir():
+            print(f"Error: Directory not found: {args.batch}")
+            sys.exit(1)
+
+        pdf_paths = sorted(args.batch.glob("*.pdf"))
+        print(f"Processing {len(pdf_paths)} PDFs from {args.batch}...")
+        results = process_files(
+            pdf_paths,
+            output_dir=args.output_dir,
+            dry_run=args.dry_run,
+            skip_ocr=args.skip_ocr,
+            model=args.model,
+            ocr_workers=args.ocr_workers,
+            llm_workers=args.llm_workers,
+        )
+
+        failed = [r for r in results if r.get("status") not in ["success", "dry_run", "ignored"]]
+        print(f"\n{'='*60}")
+        print("SUMMARY")
+        print(f"{'='*60}")
+        print(f"Processed: {len(results) - len(failed)}")
+        print(f"Failed: {len(failed)}")
+        for r in failed:
+            print(f"  - {Path(r['pdf_path']).name}: {r.get('error', 'Unknown error')}")
+
+        sys.exit(0 if not failed else 1)
+
+    if args.pdf_path is None:
+        parser.error("pdf_path is required unless --batch is given")
+
     if not args.pdf_path.exists():
         print(f"Error: File not found: {args.pdf_path}")
         sys.exit(1)
@@ -7,33 +7,49 @@ Resolution outcomes:
 - "Settlement": Negotiated agreement (everything else)
 
 For complaints without a resolution document, the frontend will show "Open".
+
+Usage:
+    uv run python scripts/utils/add_resolution_outcome.py                 # Dry run
+    uv run python scripts/utils/add_resolution_outcome.py --apply         # Fill in missing outcomes
+    uv run python scripts/utils/add_resolution_outcome.py --apply --all   # Recompute every settlement
 """
 
 import os
 import sys
-from pymongo import MongoClient
+from functools import lru_cache
+from pymongo import MongoClient, UpdateOne
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Number of updates sent per bulk_write round-trip
+BULK_WRITE_BATCH_SIZE = 1000
+
+# Lowercased marker of a contested-case (hearing) document type
+HEARING_TYPE_MARKER = "findings of fact"
+
 
+@lru_cache(maxsize=None)
 def get_resolution_outcome(doc_type: str) -> str:
-    """Determine resolution_outcome based on document type."""
+    """Determine resolution_outcome based on document type (memoized; types repeat heavily)."""
     if not doc_type:
         return "Settlement"
 
-    doc_type_lower = doc_type.lower()
-
     # Hearing: Findings of Fact documents (contested cases)
-    if "findings of fact" in doc_type_lower:
+    if HEARING_TYPE_MARKER in doc_type.lower():
         return "Hearing"
 
     # Everything else is a Settlement
     return "Settlement"
 
 
-def migrate_settlements(dry_run: bool = True):
-    """Add resolution_outcome field to all settlement documents."""
+def migrate_settlements(dry_run: bool = True, recompute_all: bool = False):
+    """
+    Add resolution_outcome field to settlement documents.
+
+    Only documents missing the field are fetched and updated, so re-runs are
+    cheap; recompute_all re-derives it for every settlement.
+    """
     uri = os.getenv("MONGODB_URI")
     if not uri:
         print("Error: MONGODB_URI not set")
@@ -42,24 +58,25 @@ def migrate_settlements(dry_run: bool = True):
     client = MongoClient(uri)
     db = client["malpractice"]
 
-    # Get all settlements
-    settlements = list(db.settlements.find({}, {"_id": 1, "type": 1, "case_numbers": 1}))
+    # Get settlements still missing the field (or all of them)
+    query = {} if recompute_all else {"resolution_outcome": {"$exists": False}}
+    settlements = list(db.settlements.find(query, {"_id": 1, "type": 1, "case_numbers": 1}))
     print(f"Found {len(settlements)} settlements to update")
 
-    # Count by outcome
-    outcome_counts = {"Settlement": 0, "Hearing": 0}
-    updates = []
-
-    for s in settlements:
-        doc_type = s.get("type", "")
-        outcome = get_resolution_outcome(doc_type)
-        outcome_counts[outcome] += 1
-        updates.append({
+    updates = [
+        {
             "_id": s["_id"],
             "case_numbers": s.get("case_numbers", []),
-            "type": doc_type,
-            "resolution_outcome": outcome
-        })
+            "type": s.get("type", ""),
+            "resolution_outcome": get_resolution_outcome(s.get("type", "")),
+        }
+        for s in settlements
+    ]
+
+    # Count by outcome
+    outcome_counts = {"Settlement": 0, "Hearing": 0}
+    for u in updates:
+        outcome_counts[u["resolution_outcome"]] += 1
 
     print(f"\nResolution outcome breakdown:")
     for outcome, count in sorted(outcome_counts.items(), key=lambda x: -x[1]):
@@ -73,21 +90,23 @@ def migrate_settlements(dry_run: bool = True):
 
         # Show some Hearing examples
         print("\nHearing examples:")
+        shown = 0
         for u in updates:
             if u["resolution_outcome"] == "Hearing":
                 print(f"  {u['case_numbers']}: {u['type']}")
-                if sum(1 for x in updates if x["resolution_outcome"] == "Hearing" and updates.index(x) <= updates.index(u)) >= 5:
+                shown += 1
+                if shown >= 5:
                     break
     else:
         print("\nApplying updates...")
+        ops = [
+            UpdateOne({"_id": u["_id"]}, {"$set": {"resolution_outcome": u["resolution_outcome"]}})
+            for u in updates
+        ]
         updated = 0
-        for u in updates:
-            result = db.settlements.update_one(
-                {"_id": u["_id"]},
-                {"$set": {"resolution_outcome": u["resolution_outcome"]}}
-            )
-            if result.modified_count > 0:
-                updated += 1
+        for i in range(0, len(ops), BULK_WRITE_BATCH_SIZE):
+            result = db.settlements.bulk_write(ops[i:i + BULK_WRITE_BATCH_SIZE], ordered=False)
+            updated += result.modified_count
 
         print(f"Updated {updated} documents")
 
@@ -96,4 +115,4 @@ def migrate_settlements(dry_run: bool = True):
 
 if __name__ == "__main__":
     dry_run = "--apply" not in sys.argv
-    migrate_settlements(dry_run=dry_run)
+    migrate_settlements(dry_run=dry_run, recompute_all="--all" in sys.argv)
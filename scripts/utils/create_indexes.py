@@ -7,126 +7,126 @@ Usage:
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from pymongo import MongoClient, ASCENDING, DESCENDING
 
 load_dotenv()
 
+# Index builds requested at once (each create_index call blocks until its build finishes)
+MAX_CONCURRENT_BUILDS = 8
 
-def create_indexes():
-    """Create indexes for complaints, settlements, and license_only_filings collections."""
-    mongo_uri = os.environ.get("MONGODB_URI")
-    if not mongo_uri:
-        raise ValueError("MONGODB_URI environment variable is required")
-
-    client = MongoClient(mongo_uri)
-    db = client["malpractice"]
-    complaints = db["complaints"]
-    settlements = db["settlements"]
-    license_only_filings = db["license_only_filings"]
-
-    print("Creating indexes for complaints collection...")
+# (collection, keys, options, description) for every index
+INDEXES = [
+    # Unique index on case_number (settlement linking does $in lookups on it).
+    # Same spec as process_complaints.py, so this is a no-op if it already exists.
+    ("complaints", "case_number", {"unique": True}, "case_number (unique)"),
 
     # Index for llm_extracted existence check (sparse)
-    complaints.create_index(
-        "llm_extracted",
-        sparse=True,
-        name="llm_extracted_sparse"
-    )
-    print("  - llm_extracted (sparse)")
+    ("complaints", "llm_extracted", {"sparse": True, "name": "llm_extracted_sparse"}, "llm_extracted (sparse)"),
 
     # Compound index for common filter combinations
-    complaints.create_index(
+    (
+        "complaints",
         [
             ("llm_extracted.category", ASCENDING),
             ("llm_extracted.specialty", ASCENDING),
             ("year", DESCENDING),
         ],
-        name="category_specialty_year"
-    )
-    print("  - category + specialty + year (compound)")
+        {"name": "category_specialty_year"},
+        "category + specialty + year (compound)",
+    ),
 
     # Index for year filtering and sorting
-    complaints.create_index(
-        "year",
-        name="year_idx"
-    )
-    print("  - year")
+    ("complaints", "year", {"name": "year_idx"}, "year"),
 
     # Index for respondent sorting
-    complaints.create_index(
-        "respondent",
-        name="respondent_idx"
-    )
-    print("  - respondent")
+    ("complaints", "respondent", {"name": "respondent_idx"}, "respondent"),
 
-    print("\nCreating indexes for settlements collection...")
+    # Index for pdf_url existence checks (process_new_filings.py)
+    ("complaints", "pdf_url", {"name": "pdf_url_idx"}, "pdf_url"),
+
+    # Index for the incremental pdf_url cache refresh (process_new_filings.py)
+    ("complaints", "processed_at", {"name": "processed_at_idx"}, "processed_at"),
+
+    # Unique index on pdf_url (upsert key; also serves the migration's pdf_url
+    # lookups). Same spec as process_settlements.py and migrate_settlements.py.
+    ("settlements", "pdf_url", {"unique": True}, "pdf_url (unique)"),
+
+    # Index for linking settlements to complaints by case number
+    ("settlements", "case_numbers", {}, "case_numbers"),
 
     # Index for llm_extracted existence check
-    settlements.create_index(
-        "llm_extracted",
-        sparse=True,
-        name="llm_extracted_sparse"
-    )
-    print("  - llm_extracted (sparse)")
+    ("settlements", "llm_extracted", {"sparse": True, "name": "llm_extracted_sparse"}, "llm_extracted (sparse)"),
 
     # Index for year in analytics queries
-    settlements.create_index(
-        "year",
-        name="year_idx"
-    )
-    print("  - year")
+    ("settlements", "year", {"name": "year_idx"}, "year"),
 
-    print("\nCreating indexes for license_only_filings collection...")
+    # Index for the incremental pdf_url cache refresh (process_new_filings.py)
+    ("settlements", "processed_at", {"name": "processed_at_idx"}, "processed_at"),
 
-    # Unique index on pdf_url
-    license_only_filings.create_index(
+    # Partial index on pdf_url for extracted settlements (process_settlements.py skip check)
+    (
+        "settlements",
         "pdf_url",
-        unique=True,
-        name="pdf_url_unique"
-    )
-    print("  - pdf_url (unique)")
+        {"partialFilterExpression": {"llm_extracted": {"$exists": True}}, "name": "pdf_url_extracted_partial"},
+        "pdf_url (partial: llm_extracted exists)",
+    ),
+
+    # Unique index on pdf_url
+    ("license_only_filings", "pdf_url", {"unique": True, "name": "pdf_url_unique"}, "pdf_url (unique)"),
 
     # Index for license_number lookups
-    license_only_filings.create_index(
-        "license_number",
-        name="license_number_idx"
-    )
-    print("  - license_number")
+    ("license_only_filings", "license_number", {"name": "license_number_idx"}, "license_number"),
 
     # Index for document type filtering
-    license_only_filings.create_index(
-        "type",
-        name="type_idx"
-    )
-    print("  - type")
+    ("license_only_filings", "type", {"name": "type_idx"}, "type"),
 
     # Index for year filtering
-    license_only_filings.create_index(
-        "year",
-        name="year_idx"
-    )
-    print("  - year")
+    ("license_only_filings", "year", {"name": "year_idx"}, "year"),
 
     # Index for respondent lookups
-    license_only_filings.create_index(
-        "respondent",
-        name="respondent_idx"
-    )
-    print("  - respondent")
+    ("license_only_filings", "respondent", {"name": "respondent_idx"}, "respondent"),
 
-    print("\nListing all indexes:")
-    print("\ncomplaints:")
-    for idx in complaints.list_indexes():
-        print(f"  - {idx['name']}: {idx['key']}")
+    # Index for the incremental pdf_url cache refresh (process_new_filings.py)
+    ("license_only_filings", "processed_at", {"name": "processed_at_idx"}, "processed_at"),
 
-    print("\nsettlements:")
-    for idx in settlements.list_indexes():
-        print(f"  - {idx['name']}: {idx['key']}")
+    # Unique index on pdf_url (bulk upserts from process_new_filings.py)
+    ("ignored_filings", "pdf_url", {"unique": True, "name": "pdf_url_unique"}, "pdf_url (unique)"),
+]
 
-    print("\nlicense_only_filings:")
-    for idx in license_only_filings.list_indexes():
-        print(f"  - {idx['name']}: {idx['key']}")
+COLLECTIONS = ["complaints", "settlements", "license_only_filings", "ignored_filings"]
+
+
+def create_indexes():
+    """Create indexes for complaints, settlements, license_only_filings, and ignored_filings collections."""
+    mongo_uri = os.environ.get("MONGODB_URI")
+    if not mongo_uri:
+        raise ValueError("MONGODB_URI environment variable is required")
+
+    client = MongoClient(mongo_uri)
+    db = client["malpractice"]
+
+    # Builds are independent, so request them concurrently (MongoClient is thread-safe)
+    def build(index):
+        collection_name, keys, options, _ = index
+        db[collection_name].create_index(keys, **options)
+
+    print(f"Creating {len(INDEXES)} indexes...")
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_BUILDS) as executor:
+        list(executor.map(build, INDEXES))
+
+    for collection_name in COLLECTIONS:
+        print(f"\n{collection_name}:")
+        for index_collection, _, _, description in INDEXES:
+            if index_collection == collection_name:
+                print(f"  - {description}")
+
+    print("\nListing all indexes:")
+    for collection_name in COLLECTIONS:
+        print(f"\n{collection_name}:")
+        for idx in db[collection_name].list_indexes():
+            print(f"  - {idx['name']}: {idx['key']}")
 
     client.close()
     print("\nDone!")
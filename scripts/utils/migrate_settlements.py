@@ -16,14 +16,56 @@ Usage:
 
 import os
 import argparse
-from collections import defaultdict
 from datetime import datetime, timezone
 
 from dotenv import load_dotenv
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne, DeleteMany
 
 load_dotenv()
 
+# Number of operations sent per bulk_write round-trip
+BULK_WRITE_BATCH_SIZE = 1000
+
+# Documents fetched per cursor batch while scanning settlements
+CURSOR_BATCH_SIZE = 1000
+
+# Fields needed to group duplicates and rebuild case/complaint arrays
+MIGRATION_PROJECTION = {
+    "_id": 1,
+    "pdf_url": 1,
+    "case_number": 1,
+    "case_numbers": 1,
+    "complaint_id": 1,
+    "complaint_ids": 1,
+    "type": 1,
+}
+
+# Group key: pdf_url, falling back to the case number for documents without one
+SETTLEMENT_GROUP_KEY = {
+    "$cond": [
+        {"$gt": [{"$ifNull": ["$pdf_url", ""]}, ""]},
+        "$pdf_url",
+        {"$concat": ["no_url_", {"$toString": {"$ifNull": [
+            "$case_number",
+            {"$ifNull": [{"$arrayElemAt": ["$case_numbers", 0]}, "unknown"]},
+        ]}}]},
+    ]
+}
+
+# Group settlements server-side, holding only _ids in memory; only duplicate
+# groups carry their ids back (their documents are then fetched by _id)
+DUPLICATE_GROUPS_PIPELINE = [
+    {"$group": {
+        "_id": SETTLEMENT_GROUP_KEY,
+        "count": {"$sum": 1},
+        "ids": {"$push": "$_id"},
+    }},
+    {"$project": {
+        "count": 1,
+        "ids": {"$cond": [{"$gt": ["$count", 1]}, "$ids", "$$REMOVE"]},
+    }},
+]
+
 
 def get_mongo_client() -> MongoClient:
     """Create MongoDB client from environment variable."""
@@ -33,6 +75,16 @@ def get_mongo_client() -> MongoClient:
     return MongoClient(mongo_uri)
 
 
+def apply_bulk(collection, ops: list):
+    """Send operations to MongoDB in unordered batches. Returns (modified, deleted) counts."""
+    modified = deleted = 0
+    for i in range(0, len(ops), BULK_WRITE_BATCH_SIZE):
+        result = collection.bulk_write(ops[i:i + BULK_WRITE_BATCH_SIZE], ordered=False)
+        modified += result.modified_count
+        deleted += result.deleted_count
+    return modified, deleted
+
+
 def migrate_settlements(apply: bool = False):
     """Migrate settlements to new schema with case_numbers array."""
     print("Connecting to MongoDB...")
@@ -40,50 +92,56 @@ def migrate_settlements(apply: bool = False):
     db = client["malpractice"]
     settlements = db["settlements"]
 
-    # Get all settlements
-    all_docs = list(settlements.find({}))
-    print(f"Found {len(all_docs)} total settlement documents")
+    # Group by pdf_url on the server (same pdf_url, multiple documents)
+    total_docs = 0
+    unique = 0
+    duplicate_ids = {}
+    for group in settlements.aggregate(DUPLICATE_GROUPS_PIPELINE, batchSize=CURSOR_BATCH_SIZE, allowDiskUse=True):
+        total_docs += group["count"]
+        if group["count"] > 1:
+            duplicate_ids[group["_id"]] = group["ids"]
+        else:
+            unique += 1
+
+    # Fetch just the duplicate documents, keeping each group's order
+    all_duplicate_ids = [doc_id for ids in duplicate_ids.values() for doc_id in ids]
+    docs_by_id = {}
+    for i in range(0, len(all_duplicate_ids), CURSOR_BATCH_SIZE):
+        batch = all_duplicate_ids[i:i + CURSOR_BATCH_SIZE]
+        for doc in settlements.find({"_id": {"$in": batch}}, MIGRATION_PROJECTION):
+            docs_by_id[doc["_id"]] = doc
+    duplicates = {
+        key: [docs_by_id[doc_id] for doc_id in ids if doc_id in docs_by_id]
+        for key, ids in duplicate_ids.items()
+    }
+
+    print(f"Found {total_docs} total settlement documents")
 
     # Check if migration is needed
     # If documents already have case_numbers array, they're already migrated
-    already_migrated = sum(1 for doc in all_docs if "case_numbers" in doc)
-    if already_migrated == len(all_docs) and already_migrated > 0:
+    already_migrated = settlements.count_documents({"case_numbers": {"$exists": True}})
+    if already_migrated == total_docs and already_migrated > 0:
         print(f"All {already_migrated} documents already have case_numbers array.")
         print("Migration may have already been run. Checking for duplicates...")
 
-    # Group documents by pdf_url
-    by_pdf_url = defaultdict(list)
-    for doc in all_docs:
-        pdf_url = doc.get("pdf_url", "")
-        if pdf_url:
-            by_pdf_url[pdf_url].append(doc)
-        else:
-            # Documents without pdf_url - use case_number as fallback
-            case_num = doc.get("case_number", doc.get("case_numbers", ["unknown"])[0] if doc.get("case_numbers") else "unknown")
-            by_pdf_url[f"no_url_{case_num}"].append(doc)
-
-    # Find duplicates (same pdf_url, multiple documents)
-    duplicates = {url: docs for url, docs in by_pdf_url.items() if len(docs) > 1}
-    unique = {url: docs[0] for url, docs in by_pdf_url.items() if len(docs) == 1}
-
-    print(f"\nUnique settlements (no duplicates): {len(unique)}")
+    print(f"\nUnique settlements (no duplicates): {unique}")
     print(f"Duplicate groups to consolidate: {len(duplicates)}")
 
     if not duplicates:
         print("\nNo duplicates found. Checking if schema update is needed...")
         # Even if no duplicates, we may need to convert case_number to case_numbers
-        need_schema_update = []
-        for doc in all_docs:
-            if "case_number" in doc and "case_numbers" not in doc:
-                need_schema_update.append(doc)
-
+        need_schema_update = list(settlements.find(
+            {"case_number": {"$exists": True}, "case_numbers": {"$exists": False}},
+            MIGRATION_PROJECTION,
+        ))
         if need_schema_update:
             print(f"Found {len(need_schema_update)} documents needing schema update (case_number -> case_numbers)")
             if apply:
+                ops = []
                 for doc in need_schema_update:
                     case_number = doc.get("case_number", "")
                     complaint_id = doc.get("complaint_id")
-                    settlements.update_one(
+                    ops.append(UpdateOne(
                         {"_id": doc["_id"]},
                         {
                             "$set": {
@@ -95,8 +153,9 @@ def migrate_settlements(apply: bool = False):
                                 "complaint_id": "",
                             }
                         }
-                    )
-                print(f"Updated {len(need_schema_update)} documents to new schema")
+                    ))
+                modified, _ = apply_bulk(settlements, ops)
+                print(f"Updated {modified} documents to new schema")
             else:
                 print("[DRY RUN] Would update these documents to new schema")
         else:
@@ -110,6 +169,7 @@ def migrate_settlements(apply: bool = False):
 
     total_docs_to_delete = 0
     consolidation_plan = []
+    details = []  # Printed in one write after the loop rather than line by line
 
     for pdf_url, docs in sorted(duplicates.items()):
         # Collect all case_numbers and complaint_ids
@@ -128,29 +188,26 @@ def migrate_settlements(apply: bool = False):
             elif "complaint_id" in doc and doc["complaint_id"]:
                 all_complaint_ids.append(doc["complaint_id"])
 
-        # Deduplicate while preserving order
-        seen_cn = set()
-        unique_case_numbers = []
-        for cn in all_case_numbers:
-            if cn and cn not in seen_cn:
-                seen_cn.add(cn)
-                unique_case_numbers.append(cn)
+        # Deduplicate while preserving order (complaint ids compared as strings,
+        # keeping the first value seen for each)
+        unique_case_numbers = [cn for cn in dict.fromkeys(all_case_numbers) if cn]
 
-        seen_cid = set()
-        unique_complaint_ids = []
+        complaint_id_by_str = {}
         for cid in all_complaint_ids:
-            if cid and str(cid) not in seen_cid:
-                seen_cid.add(str(cid))
-                unique_complaint_ids.append(cid)
+            if cid:
+                complaint_id_by_str.setdefault(str(cid), cid)
+        unique_complaint_ids = list(complaint_id_by_str.values())
 
         # Use the first document as the base (keep its _id)
         base_doc = docs[0]
         docs_to_delete = docs[1:]
 
-        print(f"\nPDF: {pdf_url[:80]}...")
-        print(f"  Documents: {len(docs)} -> 1")
-        print(f"  Case numbers: {unique_case_numbers}")
-        print(f"  Complaint IDs: {len(unique_complaint_ids)}")
+        details.append(
+            f"\nPDF: {pdf_url[:80]}...\n"
+            f"  Documents: {len(docs)} -> 1\n"
+            f"  Case numbers: {unique_case_numbers}\n"
+            f"  Complaint IDs: {len(unique_complaint_ids)}"
+        )
 
         consolidation_plan.append({
             "pdf_url": pdf_url,
@@ -162,13 +219,15 @@ def migrate_settlements(apply: bool = False):
 
         total_docs_to_delete += len(docs_to_delete)
 
+    print("\n".join(details))
+
     print(f"\n{'='*60}")
     print("SUMMARY")
     print(f"{'='*60}")
     print(f"Duplicate groups: {len(duplicates)}")
     print(f"Documents to consolidate: {sum(len(d) for d in duplicates.values())}")
     print(f"Documents to delete: {total_docs_to_delete}")
-    print(f"Final document count: {len(all_docs) - total_docs_to_delete}")
+    print(f"Final document count: {total_docs - total_docs_to_delete}")
 
     if not apply:
         print(f"\n[DRY RUN] No changes made. Run with --apply to consolidate.")
@@ -177,9 +236,10 @@ def migrate_settlements(apply: bool = False):
     # Apply consolidation
     print(f"\nApplying consolidation...")
 
+    ops = []
     for plan in consolidation_plan:
         # Update base document with consolidated data
-        settlements.update_one(
+        ops.append(UpdateOne(
             {"_id": plan["base_doc_id"]},
             {
                 "$set": {
@@ -192,23 +252,27 @@ def migrate_settlements(apply: bool = False):
                     "complaint_id": "",
                 }
             }
-        )
+        ))
 
         # Delete duplicate documents
         if plan["docs_to_delete"]:
-            settlements.delete_many({"_id": {"$in": plan["docs_to_delete"]}})
+            ops.append(DeleteMany({"_id": {"$in": plan["docs_to_delete"]}}))
 
+    _, deleted = apply_bulk(settlements, ops)
     print(f"Consolidated {len(consolidation_plan)} duplicate groups")
-    print(f"Deleted {total_docs_to_delete} duplicate documents")
+    print(f"Deleted {deleted} duplicate documents")
 
     # Update any remaining documents that haven't been migrated
     remaining = settlements.count_documents({"case_number": {"$exists": True}})
     if remaining > 0:
         print(f"\nUpdating {remaining} remaining documents to new schema...")
-        for doc in settlements.find({"case_number": {"$exists": True}}):
+        ops = []
+        for doc in settlements.find(
+            {"case_number": {"$exists": True}}, MIGRATION_PROJECTION
+        ).batch_size(CURSOR_BATCH_SIZE):
             case_number = doc.get("case_number", "")
             complaint_id = doc.get("complaint_id")
-            settlements.update_one(
+            ops.append(UpdateOne(
                 {"_id": doc["_id"]},
                 {
                     "$set": {
@@ -221,7 +285,8 @@ def migrate_settlements(apply: bool = False):
                         "complaint_id": "",
                     }
                 }
-            )
+            ))
+        apply_bulk(settlements, ops)
 
     # Drop old index and create new one
     print("\nUpdating indexes...")
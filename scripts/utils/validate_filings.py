@@ -12,15 +12,53 @@ Checks for:
 
 import json
 import re
+from itertools import islice
 from pathlib import Path
-from collections import defaultdict
+from dataclasses import dataclass, asdict
 
 DATA_DIR = Path("data")
 
+# Title prefixes (lowercased) marking an unknown document, including the "unkonwn" misspelling
+UNKNOWN_TITLE_PREFIXES = ("unknown", "unkonwn")
+
+# Check names, in the order issues are reported
+CHECK_NAMES = ("leading_zeros", "unknown_prefix", "case_format", "title_parsing", "encoding")
+
+# Filing fields the checks read, gathered one list per field by to_columns
+CHECKED_FIELDS = ("title", "case_number", "type", "respondent")
+
+# Mojibake from UTF-8 read as Latin-1 ("â€" also covers the "â€™" apostrophe)
+ENCODING_MARKERS = ("â€", "Ã")
+
+# Document number with a leading zero (e.g., 24-12345-01)
+LEADING_ZERO_PATTERN = re.compile(r'^(\d+-\d+)-0(\d+)$')
+
+# Expected case number formats, one alternation (most common first):
+# - XX-XXXXX-X (standard case number)
+# - LICENSE-XXXXX (voluntary surrender, numeric)
+# - LICENSE-RCXXXX or LICENSE-PAXXXX (alphanumeric license)
+# - XX-R-X (remediation cases)
+# - XX-00000-X (denials)
+VALID_CASE_PATTERN = re.compile(r'^(?:\d+-\d+-\d+|LICENSE-[A-Za-z]*\d+|\d+-R-\d+|\d+-00000-\d+)$')
+
+
+@dataclass(slots=True)
+class Issue:
+    year: int | str  # int from the filing records, "" when missing
+    title: str
+    case_number: str
+    type: str
+    respondent: str
+    issue: str
+    pdf_url: str
+
 
 def check_leading_zeros(case_number: str) -> str | None:
     """Check if document number has leading zeros."""
-    match = re.match(r'^(\d+-\d+)-0(\d+)$', case_number)
+    # Nearly all case numbers have no "-0" at all; skip the regex for them
+    if "-0" not in case_number:
+        return None
+    match = LEADING_ZERO_PATTERN.match(case_number)
     if match:
         return f"Leading zero in doc number: '{case_number}' -> should be '{match.group(1)}-{match.group(2)}'"
     return None
@@ -28,8 +66,8 @@ def check_leading_zeros(case_number: str) -> str | None:
 
 def check_unknown_prefix(title: str) -> str | None:
     """Check if title starts with 'unknown' or similar."""
-    lower = title.lower()
-    if lower.startswith("unknown") or lower.startswith("unkonwn"):
+    # Lowercase only the prefix-length head, not the whole title
+    if title[:7].lower().startswith(UNKNOWN_TITLE_PREFIXES):
         return f"Unknown prefix in title"
     return None
 
@@ -39,31 +77,15 @@ def check_case_number_format(case_number: str) -> str | None:
     if not case_number:
         return "Empty case number"
 
-    # Expected formats:
-    # - XX-XXXXX-X (standard case number)
-    # - LICENSE-XXXXX (voluntary surrender, numeric)
-    # - LICENSE-RCXXXX or LICENSE-PAXXXX (alphanumeric license)
-    # - XX-R-X (remediation cases)
-    # - XX-00000-X (denials)
-    if re.match(r'^\d+-\d+-\d+$', case_number):
-        return None  # Standard format OK
-    if re.match(r'^LICENSE-[A-Za-z]*\d+$', case_number):
-        return None  # License format OK (including RC, PA prefixes)
-    if re.match(r'^\d+-R-\d+$', case_number):
-        return None  # Remediation format OK
-    if re.match(r'^\d+-00000-\d+$', case_number):
-        return None  # Denial format OK
+    # Standard, license (including RC, PA prefixes), remediation, or denial format
+    if VALID_CASE_PATTERN.match(case_number):
+        return None
 
     return f"Unexpected format: '{case_number}'"
 
 
-def check_title_parsing(filing: dict) -> str | None:
+def check_title_parsing(title: str, doc_type: str, respondent: str, case_number: str) -> str | None:
     """Check if title was parsed correctly into 3 parts."""
-    title = filing.get("title", "")
-    doc_type = filing.get("type", "")
-    respondent = filing.get("respondent", "")
-    case_number = filing.get("case_number", "")
-
     # If any field is empty but title exists, parsing may have failed
     if title and (not doc_type or not respondent or not case_number):
         missing = []
@@ -80,42 +102,53 @@ def check_title_parsing(filing: dict) -> str | None:
 
 def check_unusual_characters(title: str) -> str | None:
     """Check for unusual characters that might indicate encoding issues."""
-    if "â€" in title or "Ã" in title or "â€™" in title:
+    if any(marker in title for marker in ENCODING_MARKERS):
         return "Possible encoding issue"
     return None
 
 
+def as_text(value) -> str:
+    """Coerce a non-string field value (null, number) to the text the checks expect."""
+    return "" if value is None else str(value)
+
+
+def to_columns(filings: list[dict]) -> dict[str, list[str]]:
+    """Gather the checked fields of all filings into one list of strings per field."""
+    return {
+        field: [
+            value if type(value := filing.get(field, "")) is str else as_text(value)
+            for filing in filings
+        ]
+        for field in CHECKED_FIELDS
+    }
+
+
 def validate_filings(filings: list[dict]) -> dict:
     """Run all validations and return issues grouped by type."""
-    issues = defaultdict(list)
-
-    for filing in filings:
-        title = filing.get("title", "")
-        case_number = filing.get("case_number", "")
-        year = filing.get("year", "")
-
-        # Run checks
-        checks = [
-            ("leading_zeros", check_leading_zeros(case_number)),
-            ("unknown_prefix", check_unknown_prefix(title)),
-            ("case_format", check_case_number_format(case_number)),
-            ("title_parsing", check_title_parsing(filing)),
-            ("encoding", check_unusual_characters(title)),
-        ]
+    issues = tuple([] for _ in CHECK_NAMES)
+    columns = to_columns(filings)
+
+    rows = zip(columns["title"], columns["case_number"], columns["type"], columns["respondent"])
+    for i, (title, case_number, doc_type, respondent) in enumerate(rows):
+        # Run checks, in CHECK_NAMES order
+        results = (
+            check_leading_zeros(case_number),
+            check_unknown_prefix(title),
+            check_case_number_format(case_number),
+            check_title_parsing(title, doc_type, respondent, case_number),
+            check_unusual_characters(title),
+        )
+        if not any(results):
+            continue
 
-        for check_name, result in checks:
+        filing = filings[i]
+        for check_issues, result in zip(issues, results):
             if result:
-                issues[check_name].append({
-                    "year": year,
-                    "title": title,
-                    "case_number": case_number,
-                    "type": filing.get("type", ""),
-                    "respondent": filing.get("respondent", ""),
-                    "issue": result,
-                    "pdf_url": filing.get("pdf_url", ""),
-                })
+                check_issues.append(Issue(
+                    filing.get("year", ""), title, case_number, doc_type, respondent, result, filing.get("pdf_url", ""),
+                ))
 
-    return dict(issues)
+    return {check_name: items for check_name, items in zip(CHECK_NAMES, issues) if items}
 
 
 def print_issues(issues: dict):
@@ -132,22 +165,26 @@ def print_issues(issues: dict):
     # Priority order for display
     priority = ["leading_zeros", "unknown_prefix", "encoding", "case_format", "title_parsing"]
 
+    # Build the whole report, then write it once
+    lines = []
     for check_name in priority:
         if check_name not in issues:
             continue
 
         items = issues[check_name]
-        print(f"\n\n## {check_name.upper().replace('_', ' ')} ({len(items)} issues)")
-        print("-" * 50)
+        lines.append(f"\n\n## {check_name.upper().replace('_', ' ')} ({len(items)} issues)")
+        lines.append("-" * 50)
 
-        for item in items[:20]:  # Show first 20
-            print(f"\n  Year: {item['year']}")
-            print(f"  Title: {item['title'][:80]}{'...' if len(item['title']) > 80 else ''}")
-            print(f"  Case#: {item['case_number']}")
-            print(f"  Issue: {item['issue']}")
+        for item in islice(items, 20):  # Show first 20
+            lines.append(f"\n  Year: {item.year}")
+            lines.append(f"  Title: {item.title:.80}{'...' if len(item.title) > 80 else ''}")
+            lines.append(f"  Case#: {item.case_number}")
+            lines.append(f"  Issue: {item.issue}")
 
         if len(items) > 20:
-            print(f"\n  ... and {len(items) - 20} more")
+            lines.append(f"\n  ... and {len(items) - 20} more")
+
+    print("\n".join(lines))
 
 
 def main():
@@ -157,18 +194,15 @@ def main():
     test_path = DATA_DIR / "test_2025.json"
 
     if normalized_path.exists():
-        with open(normalized_path) as f:
-            data = json.load(f)
+        data = json.loads(normalized_path.read_bytes())
         filings = data.get("filings", [])
         print(f"Loaded {len(filings)} filings from filings_normalized.json")
     elif filings_path.exists():
-        with open(filings_path) as f:
-            data = json.load(f)
+        data = json.loads(filings_path.read_bytes())
         filings = data.get("filings", [])
         print(f"Loaded {len(filings)} filings from filings.json")
     elif test_path.exists():
-        with open(test_path) as f:
-            filings = json.load(f)
+        filings = json.loads(test_path.read_bytes())
         print(f"Loaded {len(filings)} filings from test_2025.json")
     else:
         print("Error: No filings data found. Run scraper.py first.")
@@ -182,8 +216,7 @@ def main():
 
     # Save detailed report
     report_path = DATA_DIR / "validation_report.json"
-    with open(report_path, "w") as f:
-        json.dump(issues, f, indent=2)
+    report_path.write_text(json.dumps(issues, indent=2, default=asdict))
     print(f"\n\nDetailed report saved to: {report_path}")
 
 